@@ -54,12 +54,12 @@ def analyze_collapses(df):
     in_collapse = False
     region_start = None
     
-    for idx, row in cpu_df.iterrows():
-        if row['collapse'] == 1 and not in_collapse:
+    for idx, collapse in cpu_df['collapse'].items():
+        if collapse == 1 and not in_collapse:
             # Collapse starts
             in_collapse = True
             region_start = idx
-        elif row['collapse'] == 0 and in_collapse:
+        elif collapse == 0 and in_collapse:
             # Collapse ends
             in_collapse = False
             collapse_regions.append((region_start, idx - 1))
@@ -70,11 +70,11 @@ def detect_imminent_collapse(df, window_size=30, variance_threshold=0.5, rle_dro
         in_warning = False
         start_idx = None
         
-        for idx, row in cpu_df.iterrows():
-            if row['imminent_collapse'] and not in_warning:
+        for idx, imminent in cpu_df['imminent_collapse'].items():
+            if imminent and not in_warning:
                 in_warning = True
                 start_idx = idx
-            elif not row['imminent_collapse'] and in_warning:
+            elif not imminent and in_warning:
                 in_warning = False
                 warning_periods.append((start_idx, idx - 1))
         
@@ -120,22 +120,25 @@ def analyze_cross_domain(df, device_type="auto"):
         if 'rle_norm' not in device_df.columns or device_df['rle_norm'].isna().all():
             print(f"\nComputing RLE for {device} ({len(device_df)} samples)...")
             
-            for idx, row in device_df.iterrows():
-                util = row.get('util_pct', 0)
-                power = row.get('power_w', 0)
-                temp = row.get('temp_c', 0)
-                
+            # Missing inputs count as 0
+            inputs = [device_df[c] if c in device_df.columns else pd.Series(0, index=device_df.index)
+                      for c in ['util_pct', 'power_w', 'temp_c']]
+            computed = []
+            for util, power, temp in zip(*inputs):
                 # Build temp history (simplified)
                 temp_hist = [temp] * 10
                 
                 rle, rle_norm, e_th, e_pw, t_sus = compute_system_rle(
                     util, power, rated_power, temp_hist, temp_limit, device_type
                 )
-                
-                device_df.loc[idx, 'rle_computed'] = rle
-                device_df.loc[idx, 'rle_norm_computed'] = rle_norm
-                device_df.loc[idx, 'E_th_computed'] = e_th
-                device_df.loc[idx, 'E_pw_computed'] = e_pw
+                computed.append((rle, rle_norm, e_th, e_pw))
+            
+            # Assign whole columns once instead of one .loc write per cell
+            computed = np.array(computed, dtype=float)
+            device_df['rle_computed'] = computed[:, 0]
+            device_df['rle_norm_computed'] = computed[:, 1]
+            device_df['E_th_computed'] = computed[:, 2]
+            device_df['E_pw_computed'] = computed[:, 3]
         else:
             # Use existing RLE
             rle_col = 'rle_norm' if 'rle_norm' in device_df.columns else 'rle_smoothed'
@@ -138,18 +138,18 @@ if __name__ == '__main__':
     
     # Create sensor format
     output = []
-    for _, row in df.iterrows():
+    for timestamp, fps, temp in df[['timestamp', 'fps', 'temp']].itertuples(index=False, name=None):
         # Estimate util from FPS
-        util_pct = 40 + (row['fps'] / 60 * 40)
+        util_pct = 40 + (fps / 60 * 40)
         
         # Estimate power
         power_w = 3.0 + (util_pct / 100.0 * 7.0)
         
         output.append({
-            'timestamp': row['timestamp'].isoformat() + 'Z',
+            'timestamp': timestamp.isoformat() + 'Z',
             'cpu_util_pct': util_pct,
             'cpu_freq_ghz': 2.8,
-            'battery_temp_c': row['temp'],
+            'battery_temp_c': temp,
             'battery_voltage_v': 4.2,
             'battery_current_a': -power_w / 4.2,
         })
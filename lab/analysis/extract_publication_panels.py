@@ -161,12 +161,12 @@ def plot_panel_2c1_thermal_isolation(df, output_dir):
     
     # Align by timestamp
     aligned_data = []
-    for cpu_idx, cpu_row in cpu_df.iterrows():
-        gpu_close = gpu_df[abs((gpu_df['timestamp'] - cpu_row['timestamp']).dt.total_seconds()) < 1]
+    for cpu_time, cpu_temp in cpu_df[['timestamp', 'temp_c']].itertuples(index=False, name=None):
+        gpu_close = gpu_df[abs((gpu_df['timestamp'] - cpu_time).dt.total_seconds()) < 1]
         if len(gpu_close) > 0:
             gpu_row = gpu_close.iloc[0]
             aligned_data.append({
-                'cpu_temp': cpu_row['temp_c'],
+                'cpu_temp': cpu_temp,
                 'gpu_temp': gpu_row.get('vram_temp_c', gpu_row['temp_c'])
             })
     
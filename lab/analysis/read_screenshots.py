@@ -4,10 +4,55 @@ Actually read the 3DMark screenshots and extract data
 """
 
 from PIL import Image
+import numpy as np
 import glob
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+def analyze_one(screenshot):
+    """Decode one screenshot and return its metadata (runs in a worker process)"""
+    
+    filename = os.path.basename(screenshot)
+    # Extract timestamp from filename: Screenshot_20251027_154002_3DMark.jpg
+    # Format: YYYYMMDD_HHMMSS
+    if "_3DMark.jpg" not in filename:
+        return None
+    
+    timestamp_str = filename.split("_3DMark.jpg")[0].split("_")[-2:]
+    date_part = timestamp_str[0]  # 20251027
+    time_part = timestamp_str[1]  # 154002
+    
+    # Parse time
+    hour = int(time_part[:2])
+    minute = int(time_part[2:4])
+    second = int(time_part[4:6])
+    
+    result = {
+        'filename': filename,
+        'time_str': f"{hour:02d}:{minute:02d}:{second:02d}",
+        'size': None,
+        'dominant': None,
+        'error': None,
+    }
+    
+    # Load image to get dimensions
+    try:
+        img = Image.open(screenshot)
+        result['size'] = img.size
+        
+        # Try to get dominant colors as a sanity check
+        # Pack RGB into one 24-bit key and count with a single bincount
+        rgb = np.asarray(img.convert('RGB'), dtype=np.uint32)
+        keys = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+        if keys.size:
+            idx = int(np.bincount(keys.ravel()).argmax())
+            result['dominant'] = (idx >> 16 & 0xff, idx >> 8 & 0xff, idx & 0xff)
+    except Exception as e:
+        result['error'] = str(e)
+    
+    return result
+
 def analyze_screenshots():
     """Load and analyze the screenshot files"""
     
@@ -16,41 +61,23 @@ def analyze_screenshots():
     
     print(f"Found {len(screenshots)} screenshots:")
     
-    for i, screenshot in enumerate(screenshots):
-        filename = os.path.basename(screenshot)
-        # Extract timestamp from filename: Screenshot_20251027_154002_3DMark.jpg
-        # Format: YYYYMMDD_HHMMSS
-        if "_3DMark.jpg" in filename:
-            timestamp_str = filename.split("_3DMark.jpg")[0].split("_")[-2:]
-            date_part = timestamp_str[0]  # 20251027
-            time_part = timestamp_str[1]  # 154002
-            
-            # Parse time
-            hour = int(time_part[:2])
-            minute = int(time_part[2:4])
-            second = int(time_part[4:6])
-            
-            time_str = f"{hour:02d}:{minute:02d}:{second:02d}"
-            
-            # Load image to get dimensions
-            try:
-                img = Image.open(screenshot)
-                width, height = img.size
-                print(f"{i+1}. {filename}")
-                print(f"   Time: {time_str}")
-                print(f"   Size: {width}x{height}")
-                
-                # Try to get dominant colors as a sanity check
-                img_data = img.convert('RGB')
-                colors = img_data.getcolors(maxcolors=256*256*256)
-                if colors:
-                    avg_color = max(colors, key=lambda x: x[0])
-                    print(f"   Dominant color: RGB{avg_color[1]}")
-                
-                print()
-            except Exception as e:
-                print(f"   Error loading: {e}")
-                print()
+    # Decode in parallel; results come back in input order for printing
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(analyze_one, screenshots))
+    
+    for i, result in enumerate(results):
+        if result is None:
+            continue
+        if result['size'] is not None:
+            width, height = result['size']
+            print(f"{i+1}. {result['filename']}")
+            print(f"   Time: {result['time_str']}")
+            print(f"   Size: {width}x{height}")
+            if result['dominant'] is not None:
+                print(f"   Dominant color: RGB{result['dominant']}")
+        if result['error'] is not None:
+            print(f"   Error loading: {result['error']}")
+        print()
     
     print("\nI can load the images and see their metadata, but I cannot OCR text from images.")
     print("Please either:")
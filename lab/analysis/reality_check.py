@@ -8,8 +8,35 @@ import pandas as pd
 import numpy as np
 import glob
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from session_cache import CSV_ENGINE
+
+# Fixed device categories keep codes identical across sessions, so the
+# concatenated frame stays categorical and the GPU mask is an int8 compare
+DEVICE_DTYPE = pd.CategoricalDtype(['cpu', 'gpu'])
+GPU_CODE = DEVICE_DTYPE.categories.get_loc('gpu')
+
+# Only the columns the check reads. Temperatures and RLE stay float64 so the
+# reported statistics are exact; collapse is float32 because a blank flag must
+# stay NaN (skipped by the sum) rather than fail an int cast
+SESSION_COLUMNS = ['device', 'temp_c', 'rle_smoothed', 'collapse']
+SESSION_DTYPES = {
+    'device': DEVICE_DTYPE,
+    'temp_c': 'float64',
+    'rle_smoothed': 'float64',
+    'collapse': 'float32',
+}
+
+def load_session(file):
+    """Read the columns reality_check needs from one session
+    
+    Read from the CSV rather than the float32 Parquet cache, whose rounding
+    would show in the printed statistics.
+    """
+    return pd.read_csv(file, usecols=SESSION_COLUMNS, dtype=SESSION_DTYPES, engine=CSV_ENGINE)
+
 def reality_check():
     """Determine if reproducibility variance is real thermal physics or noise"""
     
@@ -22,42 +49,30 @@ def reality_check():
     
     print(f"\nFound {len(files)} sessions to analyze\n")
     
-    # Analyze temperature trends
-    temp_data = []
-    rle_data = []
-    collapse_data = []
-    
-    for file in files:
-        df = pd.read_csv(file)
-        df['session'] = file[-20:]
-        
-        # GPU data
-        gpu_data = df[df['device'] == 'gpu']
-        
-        temp_data.append({
-            'session': file[-20:],
-            'mean_temp': gpu_data['temp_c'].mean(),
-            'max_temp': gpu_data['temp_c'].max(),
-            'min_temp': gpu_data['temp_c'].min(),
-            'range': gpu_data['temp_c'].max() - gpu_data['temp_c'].min()
-        })
-        
-        rle_data.append({
-            'session': file[-20:],
-            'mean_rle': gpu_data['rle_smoothed'].mean(),
-            'std_rle': gpu_data['rle_smoothed'].std(),
-            'max_rle': gpu_data['rle_smoothed'].max(),
-        })
-        
-        collapse_data.append({
-            'session': file[-20:],
-            'collapse_rate': (gpu_data['collapse'].sum() / len(gpu_data) * 100),
-            'total_samples': len(gpu_data)
-        })
-    
-    temp_df = pd.DataFrame(temp_data)
-    rle_df = pd.DataFrame(rle_data)
-    collapse_df = pd.DataFrame(collapse_data)
+    # CSV parsing releases the GIL, so sessions load concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        dfs = list(ex.map(load_session, files))
+    
+    # Stack sessions and reduce all GPU metrics in a single groupby pass
+    all_data = pd.concat(dfs, keys=[file[-20:] for file in files], names=['session'])
+    gpu_data = all_data[all_data['device'].cat.codes == GPU_CODE]
+    stats = gpu_data.groupby(level='session', sort=False).agg(
+        mean_temp=('temp_c', 'mean'),
+        max_temp=('temp_c', 'max'),
+        min_temp=('temp_c', 'min'),
+        mean_rle=('rle_smoothed', 'mean'),
+        std_rle=('rle_smoothed', 'std'),
+        max_rle=('rle_smoothed', 'max'),
+        collapse_count=('collapse', 'sum'),
+        total_samples=('collapse', 'size'),
+    ).reset_index()
+    stats['range'] = stats['max_temp'] - stats['min_temp']
+    # Blank flags count as no collapse but still as samples
+    stats['collapse_rate'] = stats['collapse_count'].astype(float) / stats['total_samples'] * 100
+    
+    temp_df = stats[['session', 'mean_temp', 'max_temp', 'min_temp', 'range']]
+    rle_df = stats[['session', 'mean_rle', 'std_rle', 'max_rle']]
+    collapse_df = stats[['session', 'collapse_rate', 'total_samples']]
     
     print("🌡️  TEMPERATURE ANALYSIS:")
     print(temp_df.to_string(index=False))
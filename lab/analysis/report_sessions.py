@@ -2,10 +2,16 @@
 import sys
 import os
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 
+from session_cache import read_session
+from series_utils import decimate
+
 plt.rcParams.update({
 	'figure.figsize': (11, 7),
 	'axes.grid': True,
@@ -15,15 +21,24 @@ plt.rcParams.update({
 })
 
 
+# Columns plot_hour can draw; everything else is dropped at load time
+PLOT_COLUMNS = ['timestamp', 'rle_smoothed', 'rle', 'temp_c', 'power_w', 'collapse']
+
+
 def load_session(path: str) -> pd.DataFrame:
-	df = pd.read_csv(path)
+	df = read_session(path)
+	df = df[[c for c in PLOT_COLUMNS if c in df.columns]].copy()
+	# Plot series as float32; unparsable cells become NaN gaps
+	num = [c for c in df.columns if c != 'timestamp']
+	df[num] = df[num].apply(pd.to_numeric, errors='coerce').astype('float32')
 	# Parse timestamp if present
 	if 'timestamp' in df.columns:
-		df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
+		# Monitors write datetime.isoformat(); a fixed format skips per-row inference
+		df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', errors='coerce', cache=True)
 		# Drop unparsable rows
 		df = df[df['timestamp'].notna()].copy()
-		# Derive hour key
-		df['hour'] = df['timestamp'].dt.floor('H')
+		# Derive hour key in the session's own UTC offset
+		df['hour'] = df['timestamp'].dt.floor('h')
 	else:
 		# Fallback to index-based time
 		df['timestamp'] = pd.RangeIndex(start=0, stop=len(df), step=1)
@@ -37,11 +52,11 @@ def plot_hour(axs, sdf: pd.DataFrame, title: str) -> None:
 	pwr = 'power_w' if 'power_w' in sdf.columns else None
 	col = 'collapse' if 'collapse' in sdf.columns else None
 
-	t = sdf['timestamp']
+	t = sdf['timestamp'].to_numpy()
 	# RLE
 	ax = axs[0]
 	if rle:
-		ax.plot(t, sdf[rle], color='tab:blue', label='RLE')
+		ax.plot(*decimate(t, sdf[rle]), color='tab:blue', label='RLE')
 		ax.set_ylabel('RLE')
 		ax.legend(loc='upper right')
 	ax.set_title(title)
@@ -49,27 +64,38 @@ def plot_hour(axs, sdf: pd.DataFrame, title: str) -> None:
 	# Temperature
 	ax = axs[1]
 	if temp:
-		ax.plot(t, sdf[temp], color='tab:red', label='Temp °C')
+		ax.plot(*decimate(t, sdf[temp]), color='tab:red', label='Temp °C')
 		ax.set_ylabel('Temp (°C)')
 		ax.legend(loc='upper right')
 
 	# Power
 	ax = axs[2]
 	if pwr:
-		ax.plot(t, sdf[pwr], color='tab:green', label='Power W')
+		ax.plot(*decimate(t, sdf[pwr]), color='tab:green', label='Power W')
 		ax.set_ylabel('Power (W)')
 		ax.legend(loc='upper right')
 
 	# Collapse markers
 	ax = axs[3]
 	if col:
-		ax.plot(t, sdf[col], color='tab:purple', label='Collapse (0/1)')
+		# 0/1 flag: draw a line only where it fires
+		fired = np.flatnonzero(sdf[col].to_numpy() > 0)
+		ax.vlines(t[fired], 0, 1, color='tab:purple', label='Collapse (0/1)')
 		ax.set_ylabel('Collapse')
 		ax.legend(loc='upper right')
 	ax.set_xlabel('Time')
 
 
 def generate_report(paths: list[str], out_pdf: str) -> None:
+	# One figure for the whole report, cleared between pages
+	fig, axs = plt.subplots(4, 1, sharex=True)
+
+	def save_page(sdf: pd.DataFrame, title: str) -> None:
+		for ax in axs:
+			ax.cla()
+		plot_hour(axs, sdf, title)
+		pdf.savefig(fig, bbox_inches='tight')
+
 	with PdfPages(out_pdf) as pdf:
 		for p in paths:
 			if not os.path.exists(p):
@@ -79,16 +105,11 @@ def generate_report(paths: list[str], out_pdf: str) -> None:
 				continue
 			name = Path(p).name
 			# Overall page
-			fig, axs = plt.subplots(4, 1, sharex=True)
-			plot_hour(axs, df, f"{name} — Full Session")
-			pdf.savefig(fig, bbox_inches='tight')
-			plt.close(fig)
-			# Per-hour pages
-			for hour_key, sdf in df.groupby('hour'):
-				fig, axs = plt.subplots(4, 1, sharex=True)
-				plot_hour(axs, sdf, f"{name} — {hour_key}")
-				pdf.savefig(fig, bbox_inches='tight')
-				plt.close(fig)
+			save_page(df, f"{name} — Full Session")
+			# Per-hour pages, sliced by precomputed row positions
+			for hour_key, idx in sorted(df.groupby('hour').indices.items()):
+				save_page(df.iloc[idx], f"{name} — {hour_key}")
+	plt.close(fig)
 
 
 def main():
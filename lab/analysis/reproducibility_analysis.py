@@ -5,27 +5,42 @@ Analyzes three validation sessions to establish scientific reproducibility
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
 
+# orjson parses session results in C; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def load_session_result(session_dir):
+    """Load one session's timestamp_analysis.json, or None if it has none"""
+    
+    analysis_file = session_dir / "timestamp_analysis.json"
+    if not analysis_file.exists():
+        return None
+    raw = analysis_file.read_bytes()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    data['session_dir'] = str(session_dir)
+    return data
+
 def load_validation_results():
     """Load results from all three validation sessions"""
     
-    sessions = []
     bulletproof_dir = Path("sessions/bulletproof")
+    session_dirs = [d for d in sorted(bulletproof_dir.glob("*")) if d.is_dir()]
     
-    for session_dir in sorted(bulletproof_dir.glob("*")):
-        if session_dir.is_dir():
-            analysis_file = session_dir / "timestamp_analysis.json"
-            if analysis_file.exists():
-                with open(analysis_file, 'r') as f:
-                    data = json.load(f)
-                    data['session_dir'] = str(session_dir)
-                    sessions.append(data)
+    # Parse session files concurrently; map() keeps the sorted session order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(load_session_result, session_dirs)
     
-    return sessions
+    return [data for data in results if data is not None]
 
 def analyze_reproducibility(sessions):
     """Analyze reproducibility across sessions"""
@@ -53,22 +68,19 @@ def analyze_reproducibility(sessions):
     # Calculate reproducibility metrics
     print(f"\nREPRODUCIBILITY METRICS:")
     
-    # Correlation strength consistency
-    grad_rle_corrs = [c['gpu_grad_rle'] for c in correlations]
-    temp_grad_corrs = [c['gpu_temp_grad'] for c in correlations]
-    loss_rle_corrs = [c['gpu_loss_rle'] for c in correlations]
-    
-    print(f"  GPU grad_norm ↔ RLE correlation:")
-    print(f"    Mean: {np.mean(grad_rle_corrs):.3f} ± {np.std(grad_rle_corrs):.3f}")
-    print(f"    Range: {np.min(grad_rle_corrs):.3f} to {np.max(grad_rle_corrs):.3f}")
-    
-    print(f"  GPU temp ↔ grad_norm correlation:")
-    print(f"    Mean: {np.mean(temp_grad_corrs):.3f} ± {np.std(temp_grad_corrs):.3f}")
-    print(f"    Range: {np.min(temp_grad_corrs):.3f} to {np.max(temp_grad_corrs):.3f}")
-    
-    print(f"  GPU loss ↔ RLE correlation:")
-    print(f"    Mean: {np.mean(loss_rle_corrs):.3f} ± {np.std(loss_rle_corrs):.3f}")
-    print(f"    Range: {np.min(loss_rle_corrs):.3f} to {np.max(loss_rle_corrs):.3f}")
+    # Correlation strength consistency: one (sessions x pairs) array, reduced per column
+    corr_labels = ['GPU grad_norm ↔ RLE', 'GPU temp ↔ grad_norm', 'GPU loss ↔ RLE']
+    corr_matrix = np.array([[c['gpu_grad_rle'], c['gpu_temp_grad'], c['gpu_loss_rle']] for c in correlations])
+    corr_mean = corr_matrix.mean(axis=0)
+    corr_std = corr_matrix.std(axis=0)
+    corr_min = corr_matrix.min(axis=0)
+    corr_max = corr_matrix.max(axis=0)
+    grad_rle_corrs, temp_grad_corrs, loss_rle_corrs = (col.tolist() for col in corr_matrix.T)
+    
+    for k, label in enumerate(corr_labels):
+        print(f"  {label} correlation:")
+        print(f"    Mean: {corr_mean[k]:.3f} ± {corr_std[k]:.3f}")
+        print(f"    Range: {corr_min[k]:.3f} to {corr_max[k]:.3f}")
     
     # Lag consistency
     print(f"\n  Peak lag timing:")
@@ -3,13 +3,37 @@
 Revised Axiom III Validation: Probabilistic Containment with Bounds
 Implements proper drift metrics, knee-point detection, and regime segmentation
 """
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import datetime
 import json
-from scipy import stats
+
+from session_cache import CSV_ENGINE
+from series_utils import centered_mean
+
+# Numba compiles the Allan variance tau sweep; plain NumPy is the fallback
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson serializes the results (NumPy scalars included) in C; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# bottleneck's O(N) moving std replaces the strided fallback when installed
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
 
 PATHS = {
     'phone': Path('lab/sessions/archive/mobile/phone_all_benchmarks.csv'),
@@ -20,25 +44,40 @@ PATHS = {
     'pc_gpu': Path('lab/sessions/recent/rle_20251028_08.csv'),
 }
 
+# (label, path, device filter) for each dataset under test
+DATASETS = [
+    ('Phone', PATHS['phone_alt'], 'mobile'),
+    ('Laptop', PATHS['laptop_1'], 'cpu'),
+    ('PC GPU', PATHS['pc_gpu'], 'gpu'),
+]
+
+# Columns load_device_data uses; the rest are skipped at parse time
+DEVICE_COLUMNS = ['device', 'rle_smoothed', 'rle_raw', 'temp_c', 'power_w', 'util_pct', 'collapse']
+
 OUT_DIR = Path('lab/sessions/archive/plots')
-OUT_DIR.mkdir(parents=True, exist_ok=True)
+RESULTS_PATH = OUT_DIR.parent / 'REVISED_AXIOM_3_RESULTS.json'
+
+def _coerce(s):
+    """Numeric view of a column; only columns the parser left as text pay for to_numeric"""
+    return s if pd.api.types.is_numeric_dtype(s) else pd.to_numeric(s, errors='coerce')
 
 def load_device_data(path, device_type=None):
     if not path.exists():
         return None
-    df = pd.read_csv(path)
+    # pyarrow needs an explicit column list, so read the header first
+    header = pd.read_csv(path, nrows=0).columns
+    df = pd.read_csv(path, usecols=[c for c in DEVICE_COLUMNS if c in header], engine=CSV_ENGINE)
     if device_type and 'device' in df.columns:
         df = df[df['device'] == device_type]
     
     cols = {}
     if 'rle_smoothed' in df.columns:
-        cols['rle'] = pd.to_numeric(df['rle_smoothed'], errors='coerce')
+        cols['rle'] = _coerce(df['rle_smoothed'])
     elif 'rle_raw' in df.columns:
-        cols['rle'] = pd.to_numeric(df['rle_raw'], errors='coerce')
+        cols['rle'] = _coerce(df['rle_raw'])
     
-    for c in ['temp_c', 'power_w', 'util_pct', 'collapse']:
-        if c in df.columns:
-            cols[c] = pd.to_numeric(df[c], errors='coerce')
+    present = df.columns.intersection(['temp_c', 'power_w', 'util_pct', 'collapse'], sort=False)
+    cols.update({c: _coerce(df[c]) for c in present})
     
     cols['index'] = range(len(df))
     return pd.DataFrame(cols)
@@ -51,44 +90,99 @@ def detect_knee_power(data, window=20):
     if 'power_w' not in data.columns or 'rle' not in data.columns:
         return None
     
-    valid = data[['power_w', 'rle']].dropna()
-    if len(valid) < window:
+    # One shared NaN mask keeps power and RLE samples paired
+    power = data['power_w'].to_numpy(dtype=np.float64)
+    rle = data['rle'].to_numpy(dtype=np.float64)
+    valid = ~(np.isnan(power) | np.isnan(rle))
+    if valid.sum() < window:
+        return None
+    power, rle = power[valid], rle[valid]
+    
+    # Bin by power and compute mean RLE: 19 right-closed bins over the power
+    # range, matching pd.cut(bins=np.linspace(min, max, 20))
+    edges = np.linspace(power.min(), power.max(), 20)
+    bin_idx = np.searchsorted(edges, power, side='left') - 1
+    in_bins = bin_idx >= 0
+    bin_idx = bin_idx[in_bins]
+    
+    counts = np.bincount(bin_idx, minlength=len(edges) - 1)
+    occupied = counts > 0
+    if occupied.sum() < 3:
         return None
     
-    # Bin by power and compute mean RLE
-    valid_sorted = valid.sort_values('power_w')
-    bins = np.linspace(valid_sorted['power_w'].min(), valid_sorted['power_w'].max(), 20)
-    valid_sorted['bin'] = pd.cut(valid_sorted['power_w'], bins=bins)
+    mean_rle = np.bincount(bin_idx, weights=rle[in_bins], minlength=len(edges) - 1)[occupied] / counts[occupied]
+    mean_power = np.bincount(bin_idx, weights=power[in_bins], minlength=len(edges) - 1)[occupied] / counts[occupied]
     
-    bin_means = valid_sorted.groupby('bin').agg({'rle': 'mean', 'power_w': 'mean'}).reset_index()
-    bin_means = bin_means.dropna()
+    # Find peak efficiency (knee is where RLE starts dropping after peak)
+    peak_power = mean_power[np.argmax(mean_rle)]
     
-    if len(bin_means) < 3:
+    return peak_power
+
+def sorted_quantile(a, q):
+    """Linearly interpolated quantile of an already sorted array (np.quantile's default)"""
+    pos = q * (len(a) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(a) - 1)
+    return a[lo] + (pos - lo) * (a[hi] - a[lo])
+
+def summary_stats(rle, quantiles=(0.01, 0.99)):
+    """
+    Sort a NaN-free RLE array once and read all of its order statistics from it
+    Returns: dict with the sorted values, q01/q50/q99 and MAD (None if empty)
+    """
+    a = np.sort(rle)
+    if len(a) == 0:
         return None
     
-    # Find peak efficiency (knee is where RLE starts dropping after peak)
-    peak_idx = bin_means['rle'].idxmax()
-    peak_power = bin_means.loc[peak_idx, 'power_w']
+    q50 = sorted_quantile(a, 0.5)
+    
+    # MAD in one scratch buffer: subtract, abs and median all work in place
+    dev = np.subtract(a, q50)
+    np.abs(dev, out=dev)
+    mad = np.median(dev, overwrite_input=True)
     
-    return float(peak_power)
+    return {
+        'sorted': a,
+        'q01': sorted_quantile(a, quantiles[0]),
+        'q50': q50,
+        'q99': sorted_quantile(a, quantiles[1]),
+        'mad': mad,
+    }
 
-def measure_robust_drift(rle_series, quantiles=(0.01, 0.99)):
+def measure_robust_drift(stats):
     """
     Measure robust drift: winsorized range / MAD
+    Takes the summary_stats() of the RLE series
     Returns: robust drift measure
     """
-    rle_clean = rle_series.dropna()
-    if len(rle_clean) < 10:
+    if stats is None or len(stats['sorted']) < 10:
         return None
     
-    q01, q99 = np.quantile(rle_clean, quantiles)
-    mad = np.median(np.abs(rle_clean - np.median(rle_clean)))
-    
-    if mad == 0:
+    if stats['mad'] == 0:
         return None
     
-    robust_drift = (q99 - q01) / mad
-    return float(robust_drift)
+    robust_drift = (stats['q99'] - stats['q01']) / stats['mad']
+    return robust_drift
+
+def centered_rolling(x, window):
+    """
+    Centered rolling mean and std (ddof=1) of a NaN-free array
+    Matches Series.rolling(window, center=True): NaN where the window is incomplete
+    """
+    rm = centered_mean(x, window)
+    rs = np.full(len(x), np.nan)
+    if len(x) < window:
+        return rm, rs
+    
+    # Same centering as centered_mean: window k is labelled at its center row
+    start = window - 1 - (window - 1) // 2
+    if BOTTLENECK_AVAILABLE:
+        stds = bn.move_std(x, window, ddof=1)[window - 1:]
+    else:
+        # Strided view of the complete windows only (no copy), reduced row-wise
+        stds = sliding_window_view(x, window).std(axis=1, ddof=1)
+    rs[start:start + len(stds)] = stds
+    return rm, rs
 
 def segment_regimes(data, power_col='power_w', grace_period=120):
     """
@@ -103,14 +197,13 @@ def segment_regimes(data, power_col='power_w', grace_period=120):
         return [(0, len(data), 'transient')]
     
     # Compute rolling mean and std
-    rolling_mean = power.rolling(window=grace_period, center=True).mean()
-    rolling_std = power.rolling(window=grace_period, center=True).std()
+    rm, rs = centered_rolling(power.to_numpy(dtype=np.float64), grace_period)
     
-    # Detect regime changes (large shifts in power)
-    regime_changes = []
-    for i in range(grace_period, len(power) - grace_period):
-        if abs(rolling_mean.iloc[i] - rolling_mean.iloc[i - grace_period]) > 2 * rolling_std.iloc[i]:
-            regime_changes.append(i)
+    # Detect regime changes (large shifts in power): compare each i in
+    # [grace_period, len - grace_period) with i - grace_period in one pass
+    n = max(len(power) - 2 * grace_period, 0)
+    shifted = np.abs(rm[grace_period:grace_period + n] - rm[:n]) > 2 * rs[grace_period:grace_period + n]
+    regime_changes = (np.flatnonzero(shifted) + grace_period).tolist()
     
     # Split into regimes
     regimes = []
@@ -123,132 +216,209 @@ def segment_regimes(data, power_col='power_w', grace_period=120):
     
     return regimes if regimes else [(0, len(data), 'unknown')]
 
-def compute_allan_variance(rle_series, max_tau=100):
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _allan_core(x, taus):
+        """Allan variance per tau, streaming group sums without a 2-D reshape"""
+        out = np.empty(len(taus))
+        for k in prange(len(taus)):
+            tau = taus[k]
+            num_groups = x.size // tau
+            means = np.empty(num_groups)
+            for g in range(num_groups):
+                s = 0.0
+                base = g * tau
+                for j in range(tau):
+                    s += x[base + j]
+                means[g] = s / tau
+            # Variance of successive differences; their mean telescopes
+            diff_mean = (means[num_groups - 1] - means[0]) / (num_groups - 1)
+            acc = 0.0
+            for g in range(num_groups - 1):
+                d = means[g + 1] - means[g] - diff_mean
+                acc += d * d
+            out[k] = acc / (num_groups - 1)
+        return out
+
+def compute_allan_variance(rle, max_tau=100):
     """
-    Compute Allan variance over different time scales
+    Compute Allan variance of a NaN-free RLE array over different time scales
     Measures mean reversion (containment)
     """
-    rle_clean = rle_series.dropna().values
+    rle_clean = np.asarray(rle, dtype=np.float64)
     if len(rle_clean) < 2 * max_tau:
         return None, None
     
-    taus = np.logspace(0, np.log10(max_tau), 20).astype(int)
+    # Integer truncation repeats small taus (1, 1, 1, 2, 2, ...); keep each once
+    taus = np.unique(np.logspace(0, np.log10(max_tau), 20).astype(int))
     taus = taus[taus < len(rle_clean) // 2]
     
+    if NUMBA_AVAILABLE:
+        return taus, _allan_core(rle_clean, taus)
+    
+    # Group means from one cumulative sum: mean_g = (cs[(g+1)*tau] - cs[g*tau]) / tau
+    cs = np.concatenate(([0.0], np.cumsum(rle_clean, dtype=np.float64)))
     allan_vars = []
     for tau in taus:
         num_groups = len(rle_clean) // tau
         if num_groups < 2:
             break
         
-        groups = rle_clean[:num_groups * tau].reshape(num_groups, tau)
-        means = np.mean(groups, axis=1)
+        starts = np.arange(num_groups) * tau
+        means = (cs[starts + tau] - cs[starts]) / tau
         variances = np.var(np.diff(means))  # Simplified Allan variance
         allan_vars.append(variances)
     
     return taus[:len(allan_vars)], np.array(allan_vars)
 
+def analyze_dataset(label, path, dev_type):
+    """
+    Run every Axiom III test on one dataset in a single pass
+    Returns: analysis record (verdict plus plotting payload), or None without RLE data
+    """
+    data = load_device_data(path, dev_type)
+    if data is None or 'rle' not in data.columns:
+        return None
+    
+    # Drop NaNs once; every RLE metric below works on this array
+    rle = data['rle'].to_numpy(dtype=np.float64)
+    rle = rle[~np.isnan(rle)]
+    stats = summary_stats(rle)
+    
+    # 1. Detect knee power
+    pk = detect_knee_power(data)
+    
+    # 2. Robust drift measurement
+    robust_drift = measure_robust_drift(stats)
+    
+    # 3. Segment regimes
+    regimes = segment_regimes(data)
+    
+    # 4. Allan variance (mean reversion test)
+    taus, allan_vars = compute_allan_variance(rle)
+    slope = None
+    if allan_vars is not None and len(allan_vars) > 0:
+        # Check if variance decreases with time scale (mean reversion)
+        slope = np.polyfit(np.log10(taus[:len(allan_vars)]), np.log10(allan_vars + 1e-10), 1)[0]
+    
+    # 5. Evaluate containment
+    # Get power info if available
+    below_knee = True
+    mean_power = None
+    if pk and 'power_w' in data.columns:
+        mean_power = data['power_w'].mean()
+        below_knee = mean_power <= pk
+    
+    # Evaluate bounds
+    rle_range = stats['q99'] - stats['q01'] if stats else float('nan')
+    
+    if below_knee and robust_drift and robust_drift < 5.0:
+        verdict = 'PASS'
+    elif below_knee and robust_drift:
+        verdict = 'WARNING'
+    elif not below_knee:
+        verdict = 'EXEMPT'
+    else:
+        verdict = 'FAIL'
+    
+    return {
+        'label': label,
+        'rle': rle,
+        'stats': stats,
+        'P_k': pk,
+        'robust_drift': robust_drift,
+        'regimes': regimes,
+        'taus': taus,
+        'allan_vars': allan_vars,
+        'slope': slope,
+        'mean_power': mean_power,
+        'below_knee': below_knee,
+        'rle_range': rle_range,
+        'verdict': verdict,
+    }
+
+def print_dataset_report(analysis):
+    """Print the five test sections for one analyze_dataset() record"""
+    pk = analysis['P_k']
+    robust_drift = analysis['robust_drift']
+    
+    print(f"\n1. Knee Power Detection:")
+    if pk:
+        print(f"   P_k = {pk:.1f}W")
+    else:
+        print(f"   ⚠️  Could not detect knee")
+    
+    print(f"\n2. Robust Drift (Q99-Q01 / MAD):")
+    if robust_drift:
+        print(f"   delta_robust = {robust_drift:.2f}")
+    else:
+        print(f"   ⚠️  Could not compute")
+    
+    print(f"\n3. Regime Segmentation:")
+    print(f"   Found {len(analysis['regimes'])} regimes")
+    for start, end, reg_type in analysis['regimes']:
+        print(f"   [{start}:{end}] {reg_type}")
+    
+    print(f"\n4. Allan Variance (Mean Reversion):")
+    slope = analysis['slope']
+    if slope is not None:
+        print(f"   Slope: {slope:.3f}")
+        if slope < -0.5:
+            print(f"   ✅ Mean reversion confirmed (slope < -0.5)")
+        else:
+            print(f"   ⚠️  Weak mean reversion (slope ≥ -0.5)")
+    
+    print(f"\n5. Containment Evaluation:")
+    if analysis['mean_power'] is not None:
+        print(f"   Mean power: {analysis['mean_power']:.1f}W")
+        print(f"   Below knee (≤{pk:.1f}W): {analysis['below_knee']}")
+    
+    verdict = analysis['verdict']
+    if verdict == 'PASS':
+        print(f"   ✅ PASS: Robust drift < 5.0")
+    elif verdict == 'WARNING':
+        print(f"   🟡 WARNING: Robust drift = {robust_drift:.2f}")
+    elif verdict == 'EXEMPT':
+        print(f"   🟡 WARNING: Above knee power, containment not guaranteed")
+    else:
+        print(f"   🔴 FAIL: Unbounded behavior detected")
+
 def validate_revised_axiom_3():
     """
     Validate Revised Axiom III with probabilistic bounds
+    Returns: (JSON-ready results, full analysis records for plotting)
     """
     print("\n" + "="*70)
     print("REVISED AXIOM III VALIDATION: Probabilistic Containment")
     print("="*70)
     
-    datasets = [
-        ('Phone', PATHS['phone_alt'], 'mobile'),
-        ('Laptop', PATHS['laptop_1'], 'cpu'),
-        ('PC GPU', PATHS['pc_gpu'], 'gpu'),
-    ]
+    # Datasets are independent; analyze them in parallel, report in order
+    with ProcessPoolExecutor(max_workers=len(DATASETS)) as ex:
+        records = list(ex.map(analyze_dataset, *zip(*DATASETS)))
     
-    results = []
+    analyses = []
     
-    for label, path, dev_type in datasets:
+    for (label, _, _), analysis in zip(DATASETS, records):
         print(f"\n{'='*70}")
         print(f"Testing: {label}")
         print('='*70)
         
-        data = load_device_data(path, dev_type)
-        if data is None or 'rle' not in data.columns:
+        if analysis is None:
             print("⚠️  Insufficient data")
             continue
         
-        rle = data['rle'].dropna()
-        
-        # 1. Detect knee power
-        pk = detect_knee_power(data)
-        print(f"\n1. Knee Power Detection:")
-        if pk:
-            print(f"   P_k = {pk:.1f}W")
-        else:
-            print(f"   ⚠️  Could not detect knee")
-        
-        # 2. Robust drift measurement
-        robust_drift = measure_robust_drift(rle)
-        print(f"\n2. Robust Drift (Q99-Q01 / MAD):")
-        if robust_drift:
-            print(f"   delta_robust = {robust_drift:.2f}")
-        else:
-            print(f"   ⚠️  Could not compute")
-        
-        # 3. Segment regimes
-        regimes = segment_regimes(data)
-        print(f"\n3. Regime Segmentation:")
-        print(f"   Found {len(regimes)} regimes")
-        for start, end, reg_type in regimes:
-            print(f"   [{start}:{end}] {reg_type}")
-        
-        # 4. Allan variance (mean reversion test)
-        taus, allan_vars = compute_allan_variance(rle)
-        print(f"\n4. Allan Variance (Mean Reversion):")
-        if allan_vars is not None and len(allan_vars) > 0:
-            # Check if variance decreases with time scale (mean reversion)
-            slope = np.polyfit(np.log10(taus[:len(allan_vars)]), np.log10(allan_vars + 1e-10), 1)[0]
-            print(f"   Slope: {slope:.3f}")
-            if slope < -0.5:
-                print(f"   ✅ Mean reversion confirmed (slope < -0.5)")
-            else:
-                print(f"   ⚠️  Weak mean reversion (slope ≥ -0.5)")
-        
-        # 5. Evaluate containment
-        print(f"\n5. Containment Evaluation:")
-        
-        # Get power info if available
-        below_knee = True
-        if pk and 'power_w' in data.columns:
-            mean_power = data['power_w'].dropna().mean()
-            below_knee = mean_power <= pk
-            print(f"   Mean power: {mean_power:.1f}W")
-            print(f"   Below knee (≤{pk:.1f}W): {below_knee}")
-        
-        # Evaluate bounds
-        q99 = rle.quantile(0.99)
-        q01 = rle.quantile(0.01)
-        rle_range = q99 - q01
-        
-        if below_knee and robust_drift and robust_drift < 5.0:
-            print(f"   ✅ PASS: Robust drift < 5.0")
-            verdict = 'PASS'
-        elif below_knee and robust_drift:
-            print(f"   🟡 WARNING: Robust drift = {robust_drift:.2f}")
-            verdict = 'WARNING'
-        elif not below_knee:
-            print(f"   🟡 WARNING: Above knee power, containment not guaranteed")
-            verdict = 'EXEMPT'
-        else:
-            print(f"   🔴 FAIL: Unbounded behavior detected")
-            verdict = 'FAIL'
-        
-        results.append({
-            'label': label,
-            'P_k': pk,
-            'robust_drift': robust_drift,
-            'q99_q01': float(rle_range),
-            'below_knee': bool(below_knee),
-            'verdict': verdict,
-            'regimes': len(regimes),
-        })
+        print_dataset_report(analysis)
+        analyses.append(analysis)
+    
+    results = [{
+        'label': a['label'],
+        'P_k': a['P_k'],
+        'robust_drift': a['robust_drift'],
+        'q99_q01': a['rle_range'],
+        'below_knee': a['below_knee'],
+        'verdict': a['verdict'],
+        'regimes': len(a['regimes']),
+    } for a in analyses]
     
     # Summary
     print(f"\n{'='*70}")
@@ -263,29 +433,31 @@ def validate_revised_axiom_3():
     print(f"🟡 WARNING/EXEMPT: {warnings}")
     print(f"🔴 FAIL: {fails}")
     
-    return results
+    return results, analyses
 
-def visualize_revised_validation():
-    """Generate visualization of revised Axiom III validation"""
-    datasets = [
-        ('Phone', PATHS['phone_alt'], 'mobile'),
-        ('Laptop', PATHS['laptop_1'], 'cpu'),
-        ('PC GPU', PATHS['pc_gpu'], 'gpu'),
-    ]
-    
-    fig, axes = plt.subplots(3, 2, figsize=(14, 12))
+def visualize_revised_validation(analyses):
+    """Generate visualization of revised Axiom III validation from analyze_dataset() records"""
+    # Deferred: only plotting needs matplotlib, and the bare Figure API
+    # renders PNGs without pyplot's GUI backend discovery
+    from matplotlib.figure import Figure
+    
+    by_label = {a['label']: a for a in analyses}
+    
+    fig = Figure(figsize=(14, 12))
+    axes = fig.subplots(3, 2)
     fig.suptitle('Revised Axiom III: Probabilistic Containment Validation', fontsize=16, fontweight='bold')
     
-    for idx, (label, path, dev_type) in enumerate(datasets):
-        data = load_device_data(path, dev_type)
-        if data is None or 'rle' not in data.columns:
+    # Rows stay in DATASETS order; datasets without data leave their row empty
+    for idx, (label, _, _) in enumerate(DATASETS):
+        if label not in by_label:
             continue
         
-        rle = data['rle'].dropna()
+        analysis = by_label[label]
         
-        # Left: RLE timeline with bounds
-        axes[idx, 0].plot(rle.values, lw=1.5, alpha=0.7, color='blue')
-        q01, q99 = rle.quantile([0.01, 0.99])
+        # Left: RLE timeline with bounds (quantiles reused from analyze_dataset)
+        axes[idx, 0].plot(analysis['rle'], lw=1.5, alpha=0.7, color='blue')
+        stats = analysis['stats']
+        q01, q99 = (stats['q01'], stats['q99']) if stats else (np.nan, np.nan)
         axes[idx, 0].axhline(q01, color='red', linestyle='--', alpha=0.5, label='Q01')
         axes[idx, 0].axhline(q99, color='red', linestyle='--', alpha=0.5, label='Q99')
         axes[idx, 0].set_ylabel('RLE')
@@ -294,7 +466,7 @@ def visualize_revised_validation():
         axes[idx, 0].grid(alpha=0.3)
         
         # Right: Allan variance
-        taus, allan_vars = compute_allan_variance(rle)
+        taus, allan_vars = analysis['taus'], analysis['allan_vars']
         if allan_vars is not None and len(allan_vars) > 0:
             axes[idx, 1].loglog(taus[:len(allan_vars)], allan_vars + 1e-10, 'o-', lw=2, alpha=0.7)
             axes[idx, 1].set_xlabel('Time Scale τ (samples)')
@@ -305,12 +477,19 @@ def visualize_revised_validation():
             axes[idx, 1].text(0.5, 0.5, 'Insufficient data', ha='center', va='center', transform=axes[idx, 1].transAxes)
             axes[idx, 1].set_title(f'{label}: Allan Variance')
     
-    plt.tight_layout()
+    fig.tight_layout()
     fig.savefig(OUT_DIR / 'revised_axiom_3_validation.png', dpi=200, bbox_inches='tight')
-    plt.close(fig)
     print(f"\n📁 Saved: revised_axiom_3_validation.png")
 
+def _json_default(obj):
+    """Turn NumPy scalars into Python ones for the stdlib json fallback"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def main():
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    
     print("\n" + "="*70)
     print("REVISED AXIOM III VALIDATION")
     print("="*70)
@@ -321,22 +500,25 @@ def main():
     print("- Allan variance (mean reversion)")
     print("- Domain restrictions (< P_k)\n")
     
-    results = validate_revised_axiom_3()
-    visualize_revised_validation()
+    results, analyses = validate_revised_axiom_3()
+    visualize_revised_validation(analyses)
     
     # Save results
-    with open(OUT_DIR / '../REVISED_AXIOM_3_RESULTS.json', 'w') as f:
-        json.dump({
-            'timestamp': datetime.utcnow().isoformat(),
-            'results': results,
-            'tests': [
-                'knee_power_detection',
-                'robust_drift_measurement',
-                'regime_segmentation',
-                'allan_variance',
-                'domain_restrictions'
-            ]
-        }, f, indent=2)
+    payload = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'results': results,
+        'tests': [
+            'knee_power_detection',
+            'robust_drift_measurement',
+            'regime_segmentation',
+            'allan_variance',
+            'domain_restrictions'
+        ]
+    }
+    if ORJSON_AVAILABLE:
+        RESULTS_PATH.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        RESULTS_PATH.write_text(json.dumps(payload, indent=2, default=_json_default))
     
     print(f"\n📁 Results saved: REVISED_AXIOM_3_RESULTS.json\n")
 
@@ -6,50 +6,79 @@ Merges multiple sessions, overlays all metrics, marks instability windows, extra
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import PatchCollection
 import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def load_and_clean_csv(filepath):
+from session_cache import PYARROW_AVAILABLE
+from series_utils import centered_mean, decimate
+
+# Numba fuses run extraction into one pass; the np.diff edge scan is the fallback
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+PLOT_DPI = 200
+# (x, y) bins for the density panels
+DENSITY_BINS = (400, 200)
+
+MEASUREMENT_COLUMNS = ['rle_smoothed', 'power_w', 'temp_c', 'util_pct', 'a_load', 'collapse',
+                       'cpu_freq_ghz', 'vram_temp_c', 'cycles_per_joule']
+
+# Merged timelines are cached as Parquet with only the columns the analyses read
+MERGED_CACHE_DIR = Path('sessions/.cache')
+CACHE_COLUMNS = ['timestamp', 'device', 'seconds', 'alerts'] + MEASUREMENT_COLUMNS
+
+def _mismatched_lines(filepath):
+    """Line numbers (0 = header) whose field count differs from the header's
+    
+    Covers short/truncated rows (e.g. a half-written last line), which the C
+    tokenizer would pad with NaN, as well as overlong ones.
+    """
+    bad = []
+    expected = None
+    with open(filepath, 'rb') as f:
+        for line_num, line in enumerate(f):
+            if b'"' in line:
+                # Quoted fields may hold commas; count them properly
+                n_fields = len(next(csv.reader([line.decode('utf-8', 'ignore')]), []))
+            else:
+                n_fields = line.count(b',') + 1
+            if expected is None:
+                expected = n_fields
+            elif n_fields != expected:
+                bad.append(line_num)
+    return bad
+
+def load_and_clean_csv(filepath, log=print):
     """Load CSV with error handling for malformed rows"""
-    print(f"Loading: {filepath}")
+    log(f"Loading: {filepath}")
     
     rows_before = 0
     rows_after = 0
     
     try:
-        # Try reading line by line to handle malformed rows
-        import csv
-        
-        rows = []
-        col_names = None
-        expected_cols = None
-        
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            reader = csv.reader(f)
-            line_num = 0
-            
-            for line in reader:
-                line_num += 1
-                
-                if line_num == 1:
-                    # Header row
-                    col_names = line
-                    expected_cols = len(col_names)
-                    rows.append(line)
-                else:
-                    # Data row - skip if column count doesn't match
-                    if len(line) == expected_cols:
-                        rows.append(line)
-                    # Silently skip malformed lines (too many to report individually)
-        
-        if col_names is None:
-            print(f"  Error: Could not read header")
-            return None
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(rows[1:], columns=rows[0])
+        # Rows whose field count doesn't match the header are skipped up
+        # front; the python engine is the fallback for files that still trip
+        # the C tokenizer
+        read_opts = dict(skiprows=_mismatched_lines(filepath), on_bad_lines='skip',
+                         encoding='utf-8', encoding_errors='ignore')
+        try:
+            df = pd.read_csv(filepath, engine='c', low_memory=False, **read_opts)
+        except pd.errors.ParserError:
+            df = pd.read_csv(filepath, engine='python', **read_opts)
         
         rows_before = len(df)
         
@@ -57,25 +86,38 @@ def load_and_clean_csv(filepath):
         required_cols = ['timestamp', 'device', 'rle_smoothed']
         df = df.dropna(subset=required_cols)
         
-        # Remove rows where critical numeric columns are non-numeric
-        for col in ['rle_smoothed', 'power_w', 'temp_c', 'util_pct', 'a_load']:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Remove rows where RLE is non-numeric (the other measurement columns
+        # are coerced once, after the merge)
+        if not pd.api.types.is_numeric_dtype(df['rle_smoothed']):
+            df['rle_smoothed'] = pd.to_numeric(df['rle_smoothed'], errors='coerce')
+        
+        # Parse timestamps per file; unparsable ones count as malformed rows.
+        # ISO8601 accepts isoformat()'s mix of whole and fractional seconds
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True, errors='coerce')
         
         # Drop any remaining NaN in critical metrics
-        df = df.dropna(subset=['rle_smoothed'])
+        df = df.dropna(subset=['rle_smoothed', 'timestamp'])
         rows_after = len(df)
         
-        print(f"  Rows: {rows_before} -> {rows_after} (dropped {rows_before - rows_after} malformed)")
+        # Sessions are written in time order; only sort a file that isn't
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='stable')
+        
+        log(f"  Rows: {rows_before} -> {rows_after} (dropped {rows_before - rows_after} malformed)")
         
     except Exception as e:
-        print(f"  Error loading {filepath}: {e}")
+        log(f"  Error loading {filepath}: {e}")
         import traceback
         traceback.print_exc()
         return None
     
     return df
 
+def _load_buffered(filepath):
+    """load_and_clean_csv with its messages collected instead of printed"""
+    lines = []
+    return load_and_clean_csv(filepath, log=lines.append), lines
+
 def merge_sessions(csv_files):
     """Load and merge multiple session files into unified timeline"""
     
@@ -85,8 +127,15 @@ def merge_sessions(csv_files):
     
     all_dfs = []
     
-    for filepath in csv_files:
-        df = load_and_clean_csv(filepath)
+    # The C parser releases the GIL while tokenizing, so files load in threads;
+    # each file's messages are buffered and printed in input order
+    workers = min(len(csv_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as ex:
+        results = list(ex.map(_load_buffered, csv_files))
+    
+    for df, lines in results:
+        for line in lines:
+            print(line)
         if df is not None and len(df) > 0:
             all_dfs.append(df)
     
@@ -94,19 +143,30 @@ def merge_sessions(csv_files):
         print("ERROR: No valid data loaded")
         return None
     
-    # Concatenate all dataframes
+    # Concatenate the (individually sorted) files in start-time order.
+    # Consecutive sessions don't overlap, so the result is usually already
+    # sorted; otherwise a stable sort merges the k sorted runs
+    all_dfs.sort(key=lambda d: d['timestamp'].iloc[0])
     merged_df = pd.concat(all_dfs, ignore_index=True)
-    
-    # Parse timestamps
-    merged_df['timestamp'] = pd.to_datetime(merged_df['timestamp'], utc=True, errors='coerce')
-    merged_df = merged_df.dropna(subset=['timestamp'])
-    
-    # Sort by timestamp
-    merged_df = merged_df.sort_values('timestamp').reset_index(drop=True)
-    
-    # Create unified timeline (seconds from start)
-    start_time = merged_df['timestamp'].min()
-    merged_df['seconds'] = (merged_df['timestamp'] - start_time).dt.total_seconds()
+    if not merged_df['timestamp'].is_monotonic_increasing:
+        merged_df = merged_df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+    
+    # Create unified timeline (seconds from start; row 0 is the earliest after
+    # the merge) on the raw datetime64 values
+    start_time = merged_df['timestamp'].iloc[0]
+    ts = merged_df['timestamp'].to_numpy(dtype='datetime64[ns]')
+    merged_df['seconds'] = (ts - ts[0]) / np.timedelta64(1, 's')
+    
+    # Split key as a categorical; measurement columns are coerced once here and
+    # stored as float32 (sensor precision is far below float64). seconds stays
+    # float64 so multi-hour timelines keep sub-second resolution
+    merged_df['device'] = merged_df['device'].astype('category')
+    for col in merged_df.columns.intersection(MEASUREMENT_COLUMNS):
+        values = merged_df[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            # Only columns the parser left as text need element-wise coercion
+            values = pd.to_numeric(values, errors='coerce')
+        merged_df[col] = values.astype('float32')
     
     print(f"\nMerged {len(all_dfs)} session(s)")
     print(f"Total samples: {len(merged_df)}")
@@ -116,7 +176,86 @@ def merge_sessions(csv_files):
     
     return merged_df
 
-def identify_instability_windows(df):
+def merged_cache_path(csv_files):
+    """
+    Parquet cache path for a set of session files, keyed by their paths and mtimes
+    Returns None when pyarrow is missing or a file cannot be stat'ed
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+    try:
+        stamp = sorted((str(Path(p).resolve()), Path(p).stat().st_mtime_ns) for p in csv_files)
+    except OSError:
+        return None
+    key = hashlib.blake2b(repr(stamp).encode()).hexdigest()[:16]
+    return MERGED_CACHE_DIR / f'merged_{key}.parquet'
+
+def load_merged_sessions(csv_files):
+    """Merged timeline from the Parquet cache when the inputs are unchanged, else merge_sessions()"""
+    
+    cache_path = merged_cache_path(csv_files)
+    if cache_path is not None and cache_path.exists():
+        merged_df = pd.read_parquet(cache_path)
+        print("="*70)
+        print("LOADING MERGED SESSIONS FROM CACHE")
+        print("="*70)
+        print(f"Cache: {cache_path}")
+        print(f"Total samples: {len(merged_df)}")
+        print(f"Duration: {merged_df['seconds'].max() / 3600:.2f} hours")
+        print(f"Start: {merged_df['timestamp'].iloc[0]}")
+        print(f"End: {merged_df['timestamp'].iloc[-1]}")
+        return merged_df
+    
+    merged_df = merge_sessions(csv_files)
+    if cache_path is not None and merged_df is not None and len(merged_df) > 0:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            merged_df[merged_df.columns.intersection(CACHE_COLUMNS)].to_parquet(
+                cache_path, compression='zstd', index=False)
+        except Exception as e:
+            print(f"Warning: could not cache merged timeline ({e})")
+    return merged_df
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _run_bounds_core(mask):
+        """run_bounds in a single pass over the mask, without the padded diff temporaries"""
+        n = mask.size
+        starts = np.empty(n // 2 + 1, dtype=np.int64)
+        ends = np.empty(n // 2 + 1, dtype=np.int64)
+        k = 0
+        active = False
+        for i in range(n):
+            if mask[i] and not active:
+                starts[k] = i
+                active = True
+            elif not mask[i] and active:
+                ends[k] = i
+                k += 1
+                active = False
+        if active:
+            ends[k] = n - 1
+            k += 1
+        return starts[:k], ends[:k]
+
+def run_bounds(mask):
+    """
+    Index bounds of each run of True in a boolean mask
+    A run ends at its first inactive sample; one still open at the end closes on the last sample
+    """
+    if NUMBA_AVAILABLE:
+        return _run_bounds_core(mask)
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.minimum(np.flatnonzero(edges == -1), len(mask) - 1)
+    return starts, ends
+
+def split_devices(df):
+    """Split the merged timeline into one frame per device, in a single groupby pass"""
+    return {device: device_df.reset_index(drop=True)
+            for device, device_df in df.groupby('device', observed=True, sort=False)}
+
+def identify_instability_windows(by_device):
     """Mark periods where collapse or alerts are present"""
     
     instability = {
@@ -125,60 +264,33 @@ def identify_instability_windows(df):
     }
     
     for device in ['cpu', 'gpu']:
-        device_df = df[df['device'] == device].copy()
+        device_df = by_device.get(device)
         
-        if len(device_df) == 0:
+        if device_df is None or len(device_df) == 0:
             continue
         
-        # Detect instability periods
-        collapse_active = False
-        collapse_start = None
-        alerts_active = False
-        alerts_start = None
+        seconds = device_df['seconds'].to_numpy()
         
-        for idx, row in device_df.iterrows():
-            seconds = row['seconds']
-            
-            # Check collapse flag (handle as numeric)
-            collapse_val = row.get('collapse', 0)
-            try:
-                collapse_val = float(collapse_val) if pd.notna(collapse_val) else 0
-            except (ValueError, TypeError):
-                collapse_val = 0
-            is_collapse = collapse_val > 0
-            
-            # Check alerts
-            alerts = row.get('alerts', '')
-            has_alerts = pd.notna(alerts) and alerts != '' and str(alerts).strip() != ''
-            
-            # Collapse tracking
-            if is_collapse:
-                if not collapse_active:
-                    collapse_active = True
-                    collapse_start = seconds
-            else:
-                if collapse_active:
-                    instability[device].append(('collapse', collapse_start, seconds))
-                    collapse_active = False
-            if collapse_active and idx == len(device_df) - 1:
-                # Still active at end
-                instability[device].append(('collapse', collapse_start, seconds))
-            
-            # Alerts tracking
-            if has_alerts:
-                if not alerts_active:
-                    alerts_active = True
-                    alerts_start = seconds
-            else:
-                if alerts_active:
-                    instability[device].append(('alerts', alerts_start, seconds))
-                    alerts_active = False
-            if alerts_active and idx == len(device_df) - 1:
-                instability[device].append(('alerts', alerts_start, seconds))
+        # Collapse flag (handle as numeric) and non-blank alerts, as boolean masks
+        if 'collapse' in device_df.columns:
+            collapse = device_df['collapse'].fillna(0).to_numpy() > 0
+        else:
+            collapse = np.zeros(len(device_df), dtype=bool)
+        if 'alerts' in device_df.columns:
+            alerts = device_df['alerts'].fillna('').astype(str).str.strip().ne('').to_numpy()
+        else:
+            alerts = np.zeros(len(device_df), dtype=bool)
+        
+        # Report windows in the order they close, collapse before alerts on ties
+        events = []
+        for rank, (event_type, mask) in enumerate([('collapse', collapse), ('alerts', alerts)]):
+            starts, ends = run_bounds(mask)
+            events.extend((end, rank, event_type, seconds[start], seconds[end]) for start, end in zip(starts, ends))
+        instability[device] = [event[2:] for event in sorted(events)]
     
     return instability
 
-def extract_efficiency_knee(df):
+def extract_efficiency_knee(by_device):
     """Find the point where cycles_per_joule falls off while power keeps climbing"""
     
     print("\n" + "="*70)
@@ -188,19 +300,16 @@ def extract_efficiency_knee(df):
     knees = {}
     
     for device in ['cpu', 'gpu']:
-        device_df = df[df['device'] == device].copy()
+        device_df = by_device.get(device)
         
-        if len(device_df) == 0:
+        if device_df is None or len(device_df) == 0:
             continue
         
-        # Need cycles_per_joule or can compute it
+        # Need cycles_per_joule or can compute it (kept local so the plot
+        # only shows the metric when the sessions recorded it)
         if 'cycles_per_joule' not in device_df.columns:
-            # Compute from util and power
-            device_df['cycles_per_joule'] = device_df['util_pct'] / (device_df['power_w'] + 1e-3) * 100
-        
-        # Convert to numeric, handle strings
-        device_df['cycles_per_joule'] = pd.to_numeric(device_df['cycles_per_joule'], errors='coerce')
-        device_df['power_w'] = pd.to_numeric(device_df['power_w'], errors='coerce')
+            device_df = device_df.assign(
+                cycles_per_joule=device_df['util_pct'] / (device_df['power_w'] + 1e-3) * 100)
         
         # Remove any remaining NaN
         device_df = device_df.dropna(subset=['cycles_per_joule', 'power_w'])
@@ -209,34 +318,29 @@ def extract_efficiency_knee(df):
             continue
         
         # Smooth the signal
-        device_df['cycles_smooth'] = device_df['cycles_per_joule'].rolling(window=30, center=True).mean()
-        device_df['power_smooth'] = device_df['power_w'].rolling(window=30, center=True).mean()
+        cycles = device_df['cycles_per_joule'].to_numpy(dtype=np.float64)
+        power = device_df['power_w'].to_numpy(dtype=np.float64)
+        cycles_smooth = centered_mean(cycles, 30)
+        power_smooth = centered_mean(power, 30)
         
         # Find region where cycles is falling while power is rising
-        device_df['cycles_slope'] = device_df['cycles_smooth'].diff()
-        device_df['power_slope'] = device_df['power_smooth'].diff()
-        
-        # Knee: negative cycles slope AND positive power slope
-        knee_mask = (device_df['cycles_slope'] < -0.01) & (device_df['power_slope'] > 0.1)
-        knee_indices = device_df[knee_mask].index
-        
-        if len(knee_indices) > 0:
-            # Find first major knee (where efficiency drops significantly)
-            for idx in knee_indices:
-                seconds = device_df.loc[idx, 'seconds']
-                cycles = device_df.loc[idx, 'cycles_per_joule']
-                power = device_df.loc[idx, 'power_w']
-                
-                # Check if this is a significant drop (>20% from peak)
-                cycles_peak = device_df['cycles_per_joule'].max()
-                if cycles < cycles_peak * 0.8:
-                    knees[device] = {
-                        'seconds': seconds,
-                        'cycles_per_joule': cycles,
-                        'power_w': power,
-                        'rle': device_df.loc[idx, 'rle_smoothed']
-                    }
-                    break
+        cycles_slope = np.diff(cycles_smooth, prepend=np.nan)
+        power_slope = np.diff(power_smooth, prepend=np.nan)
+        
+        # Knee: negative cycles slope AND positive power slope, at a
+        # significant drop (>20% from peak)
+        cycles_peak = cycles.max()
+        knee_mask = (cycles_slope < -0.01) & (power_slope > 0.1) & (cycles < cycles_peak * 0.8)
+        
+        if knee_mask.any():
+            # First major knee (where efficiency drops significantly)
+            first = knee_mask.argmax()
+            knees[device] = {
+                'seconds': device_df['seconds'].to_numpy()[first],
+                'cycles_per_joule': cycles[first],
+                'power_w': power[first],
+                'rle': device_df['rle_smoothed'].to_numpy()[first]
+            }
         
         if device in knees:
             k = knees[device]
@@ -250,40 +354,47 @@ def extract_efficiency_knee(df):
     
     return knees
 
-def plot_comprehensive_timeline(df, instability, knees, output_dir):
+def plot_comprehensive_timeline(by_device, instability, knees, output_dir):
     """Generate comprehensive multi-panel timeline visualization"""
     
     print("\n" + "="*70)
     print("GENERATING VISUALIZATION")
     print("="*70)
     
-    # Separate devices
-    cpu_df = df[df['device'] == 'cpu'].copy()
-    gpu_df = df[df['device'] == 'gpu'].copy()
+    cpu_df = by_device.get('cpu')
+    gpu_df = by_device.get('gpu')
     
-    if len(cpu_df) == 0 or len(gpu_df) == 0:
+    if cpu_df is None or gpu_df is None:
         print("ERROR: Missing device data")
         return
     
     # Create figure with multiple subplots
+    # Fixed margins place the panels up front, so savefig needs neither a
+    # layout solver nor a bbox_inches='tight' re-render to measure the figure
     fig = plt.figure(figsize=(20, 16))
-    gs = fig.add_gridspec(6, 2, hspace=0.3, wspace=0.3)
+    gs = fig.add_gridspec(6, 2, left=0.04, right=0.985, bottom=0.035, top=0.98, hspace=0.45, wspace=0.12)
+    
+    # Full-width line panels need at most one min/max pair per output pixel
+    px = int(fig.get_figwidth() * PLOT_DPI)
     
-    # Helper to plot instability windows
+    # Helper to plot instability windows: one collection per event type, with
+    # x in data and y in axes coordinates so the bands span the full height
+    # without querying (or growing) the y-limits
     def add_instability_patches(ax, device, color='red', alpha=0.15):
         if device not in instability:
             return
+        rects = {'collapse': [], 'alerts': []}
         for event_type, start, end in instability[device]:
-            if event_type == 'collapse':
-                rect = mpatches.Rectangle((start, ax.get_ylim()[0]), end-start, 
-                                         ax.get_ylim()[1] - ax.get_ylim()[0],
-                                         facecolor=color, alpha=alpha, edgecolor=None)
-                ax.add_patch(rect)
-            elif event_type == 'alerts':
-                rect = mpatches.Rectangle((start, ax.get_ylim()[0]), end-start, 
-                                         ax.get_ylim()[1] - ax.get_ylim()[0],
-                                         facecolor='orange', alpha=alpha*0.5, edgecolor=None)
-                ax.add_patch(rect)
+            if event_type in rects:
+                rects[event_type].append(mpatches.Rectangle((start, 0), end-start, 1))
+        styles = {
+            'collapse': dict(facecolor=color, alpha=alpha),
+            'alerts': dict(facecolor='orange', alpha=alpha*0.5),
+        }
+        for event_type, patches in rects.items():
+            if patches:
+                ax.add_collection(PatchCollection(patches, edgecolor='none', transform=ax.get_xaxis_transform(),
+                                                  **styles[event_type]), autolim=False)
     
     # Helper to mark knee points
     def mark_knee(ax, device):
@@ -295,9 +406,9 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
     
     # Row 0: RLE Overlay
     ax1 = fig.add_subplot(gs[0, :])
-    ax1.plot(cpu_df['seconds'], cpu_df['rle_smoothed'], label='CPU RLE', 
+    ax1.plot(*decimate(cpu_df['seconds'], cpu_df['rle_smoothed'], px), label='CPU RLE', 
              linewidth=1.2, alpha=0.8, color='blue')
-    ax1.plot(gpu_df['seconds'], gpu_df['rle_smoothed'], label='GPU RLE', 
+    ax1.plot(*decimate(gpu_df['seconds'], gpu_df['rle_smoothed'], px), label='GPU RLE', 
              linewidth=1.2, alpha=0.8, color='red')
     add_instability_patches(ax1, 'cpu', 'blue', 0.1)
     add_instability_patches(ax1, 'gpu', 'red', 0.1)
@@ -311,9 +422,9 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
     
     # Row 1: Temperature overlay
     ax2 = fig.add_subplot(gs[1, :])
-    ax2.plot(cpu_df['seconds'], cpu_df['temp_c'], label='CPU Temp (°C)', 
+    ax2.plot(*decimate(cpu_df['seconds'], cpu_df['temp_c'], px), label='CPU Temp (°C)', 
              linewidth=1.0, alpha=0.8, color='blue')
-    ax2.plot(gpu_df['seconds'], gpu_df.get('vram_temp_c', gpu_df['temp_c']), 
+    ax2.plot(*decimate(gpu_df['seconds'], gpu_df.get('vram_temp_c', gpu_df['temp_c']), px), 
              label='GPU VRAM Temp (°C)', linewidth=1.0, alpha=0.8, color='red')
     add_instability_patches(ax2, 'cpu', 'blue', 0.1)
     add_instability_patches(ax2, 'gpu', 'red', 0.1)
@@ -327,9 +438,9 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
     
     # Row 2: Power overlay
     ax3 = fig.add_subplot(gs[2, :])
-    ax3.plot(cpu_df['seconds'], cpu_df['power_w'], label='CPU Power (W)', 
+    ax3.plot(*decimate(cpu_df['seconds'], cpu_df['power_w'], px), label='CPU Power (W)', 
              linewidth=1.0, alpha=0.8, color='blue')
-    ax3.plot(gpu_df['seconds'], gpu_df['power_w'], label='GPU Power (W)', 
+    ax3.plot(*decimate(gpu_df['seconds'], gpu_df['power_w'], px), label='GPU Power (W)', 
              linewidth=1.0, alpha=0.8, color='red')
     add_instability_patches(ax3, 'cpu', 'blue', 0.1)
     add_instability_patches(ax3, 'gpu', 'red', 0.1)
@@ -345,23 +456,13 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
     if 'cycles_per_joule' in cpu_df.columns or 'cycles_per_joule' in gpu_df.columns:
         ax4 = fig.add_subplot(gs[3, :])
         
-        # Compute if missing
-        if 'cycles_per_joule' not in cpu_df.columns:
-            cpu_df['cycles_per_joule'] = cpu_df['util_pct'] / (cpu_df['power_w'] + 1e-3) * 100
-        if 'cycles_per_joule' not in gpu_df.columns:
-            gpu_df['cycles_per_joule'] = gpu_df['util_pct'] / (gpu_df['power_w'] + 1e-3) * 100
-        
-        # Convert to numeric
-        cpu_df['cycles_per_joule'] = pd.to_numeric(cpu_df['cycles_per_joule'], errors='coerce')
-        gpu_df['cycles_per_joule'] = pd.to_numeric(gpu_df['cycles_per_joule'], errors='coerce')
-        
         # Filter out NaN
         cpu_df = cpu_df.dropna(subset=['cycles_per_joule'])
         gpu_df = gpu_df.dropna(subset=['cycles_per_joule'])
         
-        ax4.plot(cpu_df['seconds'], cpu_df['cycles_per_joule'], label='CPU Cycles/Joule', 
+        ax4.plot(*decimate(cpu_df['seconds'], cpu_df['cycles_per_joule'], px), label='CPU Cycles/Joule', 
                  linewidth=1.0, alpha=0.8, color='blue')
-        ax4.plot(gpu_df['seconds'], gpu_df['cycles_per_joule'], label='GPU Cycles/Joule', 
+        ax4.plot(*decimate(gpu_df['seconds'], gpu_df['cycles_per_joule'], px), label='GPU Cycles/Joule', 
                  linewidth=1.0, alpha=0.8, color='red')
         add_instability_patches(ax4, 'cpu', 'blue', 0.1)
         add_instability_patches(ax4, 'gpu', 'red', 0.1)
@@ -376,7 +477,7 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
     # Row 4: CPU frequency (if available)
     if 'cpu_freq_ghz' in cpu_df.columns:
         ax5 = fig.add_subplot(gs[4, :])
-        ax5.plot(cpu_df['seconds'], cpu_df['cpu_freq_ghz'], label='CPU Freq (GHz)', 
+        ax5.plot(*decimate(cpu_df['seconds'], cpu_df['cpu_freq_ghz'], px), label='CPU Freq (GHz)', 
                  linewidth=1.0, alpha=0.8, color='blue')
         add_instability_patches(ax5, 'cpu', 'blue', 0.1)
         mark_knee(ax5, 'cpu')
@@ -386,22 +487,43 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
         ax5.legend()
         ax5.grid(alpha=0.3)
     
-    # Row 5: RLE vs Time (scatter to show density)
+    # Helper to draw a device's point density as one binned image (empty bins
+    # stay transparent) instead of one marker per sample
+    def add_density(ax, x, y, cmap, alpha=1.0):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not finite.any():
+            return
+        # Short sessions get proportionally coarser bins so cells aren't mostly singletons
+        scale = min(1.0, np.sqrt(finite.sum()) / DENSITY_BINS[0])
+        bins = [max(int(n * scale), 10) for n in DENSITY_BINS]
+        counts, xedges, yedges = np.histogram2d(x[finite], y[finite], bins=bins)
+        counts[counts < 1] = np.nan
+        ax.imshow(counts.T, origin='lower', aspect='auto', interpolation='nearest',
+                  extent=(xedges[0], xedges[-1], yedges[0], yedges[-1]),
+                  cmap=cmap, vmin=0, alpha=alpha)
+    
+    # hist2d meshes have no legend entry, so the device colors get proxies
+    density_handles = [mpatches.Patch(color='blue', label='CPU'),
+                       mpatches.Patch(color='red', label='GPU')]
+    
+    # Row 5: RLE vs Time (2D histogram to show density)
     ax6 = fig.add_subplot(gs[5, 0])
-    ax6.scatter(cpu_df['seconds'], cpu_df['rle_smoothed'], s=1, alpha=0.3, color='blue', label='CPU')
-    ax6.scatter(gpu_df['seconds'], gpu_df['rle_smoothed'], s=1, alpha=0.3, color='red', label='GPU')
+    add_density(ax6, cpu_df['seconds'], cpu_df['rle_smoothed'], 'Blues')
+    add_density(ax6, gpu_df['seconds'], gpu_df['rle_smoothed'], 'Reds', alpha=0.5)
     add_instability_patches(ax6, 'cpu', 'blue', 0.1)
     add_instability_patches(ax6, 'gpu', 'red', 0.1)
     ax6.set_xlabel('Time (seconds)', fontsize=10)
     ax6.set_ylabel('RLE', fontsize=10)
-    ax6.set_title('RLE Scatter (Full Dataset)', fontsize=12, fontweight='bold')
-    ax6.legend()
+    ax6.set_title('RLE Density (Full Dataset)', fontsize=12, fontweight='bold')
+    ax6.legend(handles=density_handles)
     ax6.grid(alpha=0.3)
     
     # RLE efficiency curve
     ax7 = fig.add_subplot(gs[5, 1])
-    ax7.scatter(cpu_df['power_w'], cpu_df['rle_smoothed'], s=1, alpha=0.3, color='blue', label='CPU')
-    ax7.scatter(gpu_df['power_w'], gpu_df['rle_smoothed'], s=1, alpha=0.3, color='red', label='GPU')
+    add_density(ax7, cpu_df['power_w'], cpu_df['rle_smoothed'], 'Blues')
+    add_density(ax7, gpu_df['power_w'], gpu_df['rle_smoothed'], 'Reds', alpha=0.5)
     if 'cpu' in knees:
         ax7.scatter(knees['cpu']['power_w'], knees['cpu']['rle'], 
                    s=200, color='purple', marker='*', edgecolor='black', 
@@ -413,111 +535,141 @@ def plot_comprehensive_timeline(df, instability, knees, output_dir):
     ax7.set_xlabel('Power (W)', fontsize=10)
     ax7.set_ylabel('RLE', fontsize=10)
     ax7.set_title('RLE vs Power (Efficiency Map)', fontsize=12, fontweight='bold')
-    ax7.legend()
+    ax7.legend(handles=density_handles + ax7.get_legend_handles_labels()[0])
     ax7.grid(alpha=0.3)
     
-    plt.savefig(f'{output_dir}/rle_comprehensive_timeline.png', dpi=200, bbox_inches='tight')
+    plt.savefig(f'{output_dir}/rle_comprehensive_timeline.png', dpi=PLOT_DPI)
     print(f"\nSaved: {output_dir}/rle_comprehensive_timeline.png")
     plt.close()
 
-def print_analysis_summary(df, instability, knees):
-    """Print comprehensive analysis summary"""
-    
-    print("\n" + "="*70)
-    print("ANALYSIS SUMMARY")
-    print("="*70)
+def first_drop_seconds(dev_df, fraction=0.5):
+    """Time of the first sample below fraction * peak RLE (inf if none)
+    
+    Rows are in time order, so the first hit is the earliest; argmax finds it
+    without building a filtered frame.
+    """
+    rle = dev_df['rle_smoothed'].to_numpy()
+    if len(rle) == 0:
+        return np.inf
+    below = rle < rle.max() * fraction
+    idx = np.argmax(below)
+    return dev_df['seconds'].to_numpy()[idx] if below[idx] else np.inf
+
+def print_analysis_summary(df, by_device, instability, knees):
+    """Print comprehensive analysis summary and return it as a JSON-ready dict
+    
+    Lines are collected and written to stdout in one call.
+    """
+    lines = ["\n" + "="*70, "ANALYSIS SUMMARY", "="*70]
+    summary = {'devices': {}, 'knees': {}, 'insights': []}
+    
+    # Per-device statistics in one grouped pass over the merged timeline
+    aggs = dict(
+        samples=('rle_smoothed', 'size'),
+        duration=('seconds', 'max'),
+        rle_mean=('rle_smoothed', 'mean'),
+        rle_std=('rle_smoothed', 'std'),
+        rle_min=('rle_smoothed', 'min'),
+        rle_max=('rle_smoothed', 'max'),
+    )
+    if 'collapse' in df.columns:
+        aggs['collapses'] = ('collapse', 'sum')
+    stats = df.groupby('device', observed=True).agg(**aggs)
     
     for device in ['cpu', 'gpu']:
-        device_df = df[df['device'] == device].copy()
-        
-        if len(device_df) == 0:
+        if device not in stats.index:
             continue
+        st = stats.loc[device]
         
-        print(f"\n{device.upper()}:")
-        print(f"  Samples: {len(device_df)}")
-        print(f"  Duration: {device_df['seconds'].max() / 3600:.2f} hours")
+        lines.append(f"\n{device.upper()}:")
+        lines.append(f"  Samples: {int(st['samples'])}")
+        lines.append(f"  Duration: {st['duration'] / 3600:.2f} hours")
         
         # RLE stats
-        print(f"  RLE: {device_df['rle_smoothed'].mean():.2f} ± {device_df['rle_smoothed'].std():.2f}")
-        print(f"    Min: {device_df['rle_smoothed'].min():.2f}, Max: {device_df['rle_smoothed'].max():.2f}")
+        lines.append(f"  RLE: {st['rle_mean']:.2f} ± {st['rle_std']:.2f}")
+        lines.append(f"    Min: {st['rle_min']:.2f}, Max: {st['rle_max']:.2f}")
         
         # Collapse count
-        if 'collapse' in device_df.columns:
-            collapse_col = pd.to_numeric(device_df['collapse'], errors='coerce')
-            collapse_count = int(collapse_col.sum()) if pd.notna(collapse_col.sum()) else 0
-        else:
-            collapse_count = 0
-        collapse_pct = (collapse_count / len(device_df)) * 100 if len(device_df) > 0 else 0
-        print(f"  Collapses: {collapse_count} ({collapse_pct:.1f}%)")
+        collapse_count = int(st.get('collapses', 0))
+        collapse_pct = (collapse_count / st['samples']) * 100
+        lines.append(f"  Collapses: {collapse_count} ({collapse_pct:.1f}%)")
         
         # Instability windows
         windows = instability.get(device, [])
-        print(f"  Instability windows: {len(windows)}")
+        lines.append(f"  Instability windows: {len(windows)}")
         for event_type, start, end in windows:
-            print(f"    {event_type}: {start/3600:.2f}h - {end/3600:.2f}h ({end-start:.0f}s)")
+            lines.append(f"    {event_type}: {start/3600:.2f}h - {end/3600:.2f}h ({end-start:.0f}s)")
         
         # Knee
         if device in knees:
-            print(f"  Knee detected at {knees[device]['seconds']/3600:.2f}h")
-    
-    print("\n" + "="*70)
-    print("KEY INSIGHTS")
-    print("="*70)
+            lines.append(f"  Knee detected at {knees[device]['seconds']/3600:.2f}h")
+            summary['knees'][device] = {k: float(v) for k, v in knees[device].items()}
+        
+        summary['devices'][device] = {
+            **{k: float(v) for k, v in st.items()},
+            'samples': int(st['samples']),
+            'collapses': collapse_count,
+            'instability_windows': [
+                {'type': event_type, 'start_s': float(start), 'end_s': float(end)}
+                for event_type, start, end in windows
+            ],
+        }
+    
+    lines += ["\n" + "="*70, "KEY INSIGHTS", "="*70]
+    insights = summary['insights']
     
     # Which device becomes limiting factor first
-    cpu_df = df[df['device'] == 'cpu'].copy()
-    gpu_df = df[df['device'] == 'gpu'].copy()
+    cpu_df = by_device.get('cpu')
+    gpu_df = by_device.get('gpu')
     
-    if len(cpu_df) > 0 and len(gpu_df) > 0:
+    if cpu_df is not None and gpu_df is not None:
         # Find when each device's RLE drops below 50% of its peak
-        cpu_peak = cpu_df['rle_smoothed'].max()
-        gpu_peak = gpu_df['rle_smoothed'].max()
+        cpu_first = first_drop_seconds(cpu_df)
+        gpu_first = first_drop_seconds(gpu_df)
         
-        cpu_low = cpu_df[cpu_df['rle_smoothed'] < cpu_peak * 0.5]
-        gpu_low = gpu_df[gpu_df['rle_smoothed'] < gpu_peak * 0.5]
-        
-        if len(cpu_low) > 0 and len(gpu_low) > 0:
-            cpu_first = cpu_low['seconds'].min()
-            gpu_first = gpu_low['seconds'].min()
-            
+        if np.isfinite(cpu_first) and np.isfinite(gpu_first):
             if cpu_first < gpu_first:
-                print("CPU becomes limiting factor first (thermal inefficiency)")
+                insights.append("CPU becomes limiting factor first (thermal inefficiency)")
             else:
-                print("GPU becomes limiting factor first (thermal inefficiency)")
+                insights.append("GPU becomes limiting factor first (thermal inefficiency)")
         else:
-            print("Both devices maintain >50% of peak RLE")
+            insights.append("Both devices maintain >50% of peak RLE")
+        lines.append(insights[-1])
     
     # Predictive control viability
     # Check if RLE drops BEFORE collapse flags
-    for device in ['cpu', 'gpu']:
-        device_df = df[df['device'] == device].copy()
-        if len(device_df) == 0 or 'collapse' not in device_df.columns:
-            continue
-        
-        # Find collapse periods (convert to numeric first)
-        if 'collapse' in device_df.columns:
-            collapse_col = pd.to_numeric(device_df['collapse'], errors='coerce').fillna(0)
-            collapses = device_df[collapse_col > 0]
-        else:
-            collapses = pd.DataFrame()
-        
-        if len(collapses) > 0:
-            first_collapse_time = collapses['seconds'].min()
-            before_collapse = device_df[device_df['seconds'] < first_collapse_time]
+    if 'collapse' in df.columns:
+        flagged = (df['collapse'] > 0).to_numpy()
+        first_collapse = df[flagged].groupby('device', observed=True)['seconds'].min()
+        
+        # Each row's device's first collapse time, looked up by category code
+        codes = df['device'].cat.codes.to_numpy()
+        first_by_code = first_collapse.reindex(df['device'].cat.categories).to_numpy()
+        before = df['seconds'].to_numpy() < first_by_code[codes]
+        
+        avg_rle_before = df[before].groupby('device', observed=True)['rle_smoothed'].mean()
+        avg_rle_collapse = df[flagged].groupby('device', observed=True)['rle_smoothed'].mean()
+        
+        for device in ['cpu', 'gpu']:
+            if device not in avg_rle_before.index or device not in avg_rle_collapse.index:
+                continue
+            rle_before = avg_rle_before[device]
+            rle_collapse = avg_rle_collapse[device]
             
-            if len(before_collapse) > 0:
-                avg_rle_before = before_collapse['rle_smoothed'].mean()
-                avg_rle_collapse = collapses['rle_smoothed'].mean()
-                
-                if avg_rle_before > avg_rle_collapse:
-                    drop = ((avg_rle_before - avg_rle_collapse) / avg_rle_before) * 100
-                    print(f"{device.upper()}: RLE drops {drop:.1f}% before collapse detected")
-                    print(f"  → Predictive control viable (early warning system)")
+            if rle_before > rle_collapse:
+                drop = ((rle_before - rle_collapse) / rle_before) * 100
+                insights.append(f"{device.upper()}: RLE drops {drop:.1f}% before collapse detected")
+                lines.append(insights[-1])
+                lines.append(f"  → Predictive control viable (early warning system)")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return summary
 
 def main():
     parser = argparse.ArgumentParser(description="RLE comprehensive timeline analysis")
     parser.add_argument("csv_files", nargs='+', help="CSV files to merge and analyze")
     parser.add_argument("--plot", action="store_true", help="Generate comprehensive visualization")
+    parser.add_argument("--json", metavar="PATH", help="Also write the analysis summary as JSON")
     
     args = parser.parse_args()
     
@@ -525,27 +677,33 @@ def main():
     print("RLE COMPREHENSIVE TIMELINE ANALYSIS")
     print("="*70)
     
-    # Merge sessions
-    merged_df = merge_sessions(args.csv_files)
+    # Merge sessions (cached as Parquet across runs)
+    merged_df = load_merged_sessions(args.csv_files)
     
     if merged_df is None or len(merged_df) == 0:
         print("ERROR: No data to analyze")
         return
     
+    # Split by device once; every analysis works on the per-device frames
+    by_device = split_devices(merged_df)
+    
     # Identify instability windows
-    instability = identify_instability_windows(merged_df)
+    instability = identify_instability_windows(by_device)
     
     # Extract efficiency knee
-    knees = extract_efficiency_knee(merged_df)
+    knees = extract_efficiency_knee(by_device)
     
     # Print summary
-    print_analysis_summary(merged_df, instability, knees)
+    summary = print_analysis_summary(merged_df, by_device, instability, knees)
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+        print(f"\nSaved: {args.json}")
     
     # Generate visualization
     if args.plot:
         output_dir = Path("sessions/archive/plots")
         output_dir.mkdir(parents=True, exist_ok=True)
-        plot_comprehensive_timeline(merged_df, instability, knees, output_dir)
+        plot_comprehensive_timeline(by_device, instability, knees, output_dir)
     
     print("\n" + "="*70)
     print("ANALYSIS COMPLETE")
@@ -7,11 +7,145 @@ Find what variables most strongly relate to RLE and analyze collapse events
 import pandas as pd
 import numpy as np
 from scipy import stats
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score, mean_squared_error
 import argparse
+from pathlib import Path
 
-def correlation_analysis(cpu_df):
+from session_cache import CSV_ENGINE
+
+# Numba fuses each driver's correlation sums into one loop over the rows; the
+# einsum formulation is the fallback
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Only the columns the analyses read are parsed, with device as a categorical.
+# Measurements stay float64: a_load tracks power_w almost exactly, and float32
+# rounding of the pair swings the regression coefficients
+SESSION_COLUMNS = ['timestamp', 'device', 'rle_smoothed', 'rle_raw', 'util_pct', 'power_w', 'a_load',
+                   't_sustain_s', 'rolling_peak', 'E_th', 'E_pw', 'collapse']
+MEASUREMENT_COLUMNS = ['rle_smoothed', 'rle_raw', 'util_pct', 'power_w', 'a_load', 't_sustain_s',
+                       'rolling_peak', 'E_th', 'E_pw']
+
+BAR = "=" * 70 + "\n"
+
+# p-value cut-offs and the significance label for each bin between them
+SIG_LEVELS = np.array([0.001, 0.01, 0.05])
+SIG_LABELS = np.array(['***', '**', '*', 'ns'])
+
+def column_arrays(df):
+    """Each numeric session column as a float64 ndarray, keyed by name
+    
+    The analyses index these plain arrays instead of going back through the
+    DataFrame for every column access.
+    """
+    return {c: df[c].to_numpy(dtype=np.float64) for c in df.columns
+            if c in MEASUREMENT_COLUMNS or c == 'collapse'}
+
+def load_session(path):
+    """Read the analysed columns of a session CSV with explicit dtypes"""
+    # pyarrow needs an explicit column list, so read the header first
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {c: 'float64' for c in MEASUREMENT_COLUMNS if c in header}
+    if 'device' in header:
+        dtypes['device'] = 'category'
+    df = pd.read_csv(path, usecols=[c for c in SESSION_COLUMNS if c in header],
+                     dtype=dtypes, engine=CSV_ENGINE)
+    
+    # Parsed once here (pyarrow usually hands back datetimes already). ISO8601
+    # accepts isoformat()'s mix of whole and fractional seconds without per-row
+    # format inference, which would turn one of the variants into NaT
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True, errors='coerce')
+    return df
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _pearson_kernel(y, X):
+        """Per-column r and pair count, one column per thread, two passes over the rows"""
+        n_rows, k = X.shape
+        r = np.full(k, np.nan)
+        counts = np.zeros(k, np.int64)
+        for j in prange(k):
+            sx = 0.0
+            sy = 0.0
+            c = 0
+            x_lo = np.inf
+            x_hi = -np.inf
+            y_lo = np.inf
+            y_hi = -np.inf
+            for i in range(n_rows):
+                xi = X[i, j]
+                yi = y[i]
+                if np.isfinite(xi) and np.isfinite(yi):
+                    sx += xi
+                    sy += yi
+                    c += 1
+                    x_lo = min(x_lo, xi)
+                    x_hi = max(x_hi, xi)
+                    y_lo = min(y_lo, yi)
+                    y_hi = max(y_hi, yi)
+            counts[j] = c
+            # Undefined for a constant input, as in pearsonr
+            if c == 0 or x_lo == x_hi or y_lo == y_hi:
+                continue
+            mx = sx / c
+            my = sy / c
+            sxx = 0.0
+            syy = 0.0
+            sxy = 0.0
+            for i in range(n_rows):
+                xi = X[i, j]
+                yi = y[i]
+                if np.isfinite(xi) and np.isfinite(yi):
+                    dx = xi - mx
+                    dy = yi - my
+                    sxx += dx * dx
+                    syy += dy * dy
+                    sxy += dx * dy
+            r[j] = min(max(sxy / np.sqrt(sxx * syy), -1.0), 1.0)
+        return r, counts
+
+def _pearson_numpy(y, X):
+    """Per-column r and pair count with masked einsum reductions"""
+    y = y[:, None]
+    valid = np.isfinite(X) & np.isfinite(y)
+    n = valid.sum(axis=0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Center each column on its own valid rows; invalid rows contribute 0
+        xc = np.where(valid, X - np.where(valid, X, 0).sum(axis=0) / n, 0)
+        yc = np.where(valid, y - np.where(valid, y, 0).sum(axis=0) / n, 0)
+        num = np.einsum('ij,ij->j', xc, yc)
+        den = np.sqrt(np.einsum('ij,ij->j', xc, xc) * np.einsum('ij,ij->j', yc, yc))
+        r = np.clip(num / den, -1.0, 1.0)
+    
+    # Undefined for a constant input (pearsonr returns NaN); rounding in the
+    # mean would otherwise leave a spurious near-zero r
+    x_const = np.where(valid, X, np.inf).min(axis=0) == np.where(valid, X, -np.inf).max(axis=0)
+    y_const = np.where(valid, y, np.inf).min(axis=0) == np.where(valid, y, -np.inf).max(axis=0)
+    r[x_const | y_const] = np.nan
+    return r, n
+
+def pearson_columns(y, X):
+    """
+    Pearson r and two-sided p-value of y against every column of X in one pass
+    Each column uses the rows where both it and y are present (as pearsonr on
+    the pairwise-dropped data would); returns arrays r, p and sample counts n
+    """
+    if NUMBA_AVAILABLE:
+        # Column-major so each thread walks its own column contiguously
+        r, n = _pearson_kernel(y, np.asfortranarray(X))
+    else:
+        r, n = _pearson_numpy(y, X)
+    
+    # p-value from the t statistic with n-2 degrees of freedom
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = r * np.sqrt((n - 2) / (1 - r * r))
+        p = 2 * stats.t.sf(np.abs(t), n - 2)
+    return r, p, n
+
+def correlation_analysis(cols):
     """Find which metrics correlate most strongly with RLE"""
     print("="*70)
     print("CORRELATION ANALYSIS")
@@ -22,7 +156,7 @@ def correlation_analysis(cpu_df):
     
     # Potential drivers
     driver_cols = ['util_pct', 'power_w', 'a_load', 't_sustain_s', 'rolling_peak', 'E_th', 'E_pw']
-    driver_cols = [c for c in driver_cols if c in cpu_df.columns]
+    driver_cols = [c for c in driver_cols if c in cols]
     
     print(f"\nAnalyzing correlation with {target}:")
     print("-"*70)
@@ -31,16 +165,15 @@ def correlation_analysis(cpu_df):
     
     correlations = []
     
-    for col in driver_cols:
-        # Remove NaN values
-        mask = cpu_df[target].notna() & cpu_df[col].notna()
-        x = cpu_df.loc[mask, col]
-        y = cpu_df.loc[mask, target]
-        
-        if len(x) > 10:  # Need minimum samples
-            r, p = stats.pearsonr(x, y)
-            sig = "***" if p < 0.001 else "**" if p < 0.01 else "*" if p < 0.05 else "ns"
-            
+    X = np.column_stack([cols[c] for c in driver_cols])
+    r_all, p_all, n_all = pearson_columns(cols[target], X)
+    
+    # Significance stars for all drivers at once: p < 0.001 -> ***, < 0.01 -> **,
+    # < 0.05 -> *, otherwise (or NaN) ns
+    sig_all = SIG_LABELS[np.searchsorted(SIG_LEVELS, p_all, side='right')]
+    
+    for col, r, p, n, sig in zip(driver_cols, r_all, p_all, n_all, sig_all):
+        if n > 10:  # Need minimum samples
             print(f"{col:<20} {r:>8.4f}       {sig}")
             correlations.append((col, r, p))
     
@@ -53,7 +186,7 @@ def correlation_analysis(cpu_df):
     
     return correlations
 
-def regression_model(cpu_df):
+def regression_model(cols):
     """Build regression model to predict RLE"""
     print("\n" + "="*70)
     print("REGRESSION MODEL")
@@ -61,67 +194,80 @@ def regression_model(cpu_df):
     
     # Features
     feature_cols = ['util_pct', 'power_w', 'a_load', 'E_th', 'E_pw']
-    feature_cols = [c for c in feature_cols if c in cpu_df.columns]
+    feature_cols = [c for c in feature_cols if c in cols]
     
     # Target
     target = 'rle_smoothed'
     
     # Prepare data
-    mask = cpu_df[target].notna()
-    for col in feature_cols:
-        mask &= cpu_df[col].notna()
-    
-    X = cpu_df.loc[mask, feature_cols]
-    y = cpu_df.loc[mask, target]
+    X = np.column_stack([cols[c] for c in feature_cols])
+    y = cols[target]
+    mask = ~np.isnan(y) & ~np.isnan(X).any(axis=1)
+    X = X[mask]
+    y = y[mask]
     
     print(f"Using {len(X)} samples")
     print(f"Features: {feature_cols}")
     
-    # Train model
-    model = LinearRegression()
-    model.fit(X, y)
-    
-    # Predictions
-    y_pred = model.predict(X)
-    
-    # Metrics
-    r2 = r2_score(y, y_pred)
-    rmse = np.sqrt(mean_squared_error(y, y_pred))
+    # Ordinary least squares on centered data; the intercept is recovered from
+    # the means. lstsq (SVD) rather than the normal equations because a_load is
+    # power_w / rated power, so X^T X is singular up to rounding and only the
+    # minimum-norm solution is stable
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - x_mean
+    yc = y - y_mean
+    coef = np.linalg.lstsq(Xc, yc, rcond=None)[0]
+    intercept = y_mean - x_mean @ coef
+    model = {'coef': coef, 'intercept': intercept}
+    
+    # Metrics from one residual vector: R² = 1 - SS_res/SS_tot, RMSE = sqrt(SS_res/n)
+    resid = yc - Xc @ coef
+    ss_res = np.einsum('i,i->', resid, resid)
+    ss_tot = np.einsum('i,i->', yc, yc)
+    r2 = 1 - ss_res / ss_tot
+    rmse = np.sqrt(ss_res / len(resid))
     
     print(f"\nModel Performance:")
     print(f"  R² Score: {r2:.4f}")
     print(f"  RMSE: {rmse:.4f}")
     
     print("\nFeature Importance (coefficients):")
-    for i, (feature, coef) in enumerate(zip(feature_cols, model.coef_)):
-        print(f"  {feature:<15} {coef:>10.4f}")
+    for feature, weight in zip(feature_cols, coef):
+        print(f"  {feature:<15} {weight:>10.4f}")
     
-    print(f"\nIntercept: {model.intercept_:.4f}")
+    print(f"\nIntercept: {intercept:.4f}")
     
-    return model, X.columns.tolist()
+    return model, feature_cols
+
+def nan_stat(values, func):
+    """Apply func to the non-NaN values (NaN if there are none), like the pandas reductions"""
+    values = values[~np.isnan(values)]
+    return func(values) if len(values) else np.nan
 
-def collapse_analysis(cpu_df):
+def collapse_analysis(cols):
     """Analyze RLE behavior during collapse events"""
     print("\n" + "="*70)
     print("COLLAPSE ANALYSIS")
     print("="*70)
     
-    if 'collapse' not in cpu_df.columns:
+    if 'collapse' not in cols:
         print("No collapse data available")
         return
     
-    collapsed = cpu_df[cpu_df['collapse'] == 1]
-    normal = cpu_df[cpu_df['collapse'] == 0]
+    # Row positions of collapsed samples from one scan of the flag
+    collapse_arr = cols['collapse']
+    col_idx = np.flatnonzero(collapse_arr == 1)
     
-    if len(collapsed) == 0:
+    if len(col_idx) == 0:
         print("\nNo collapse events detected in this dataset")
         print("\nCollapse detection appears to be working correctly -")
         print("no events at moderate loads means detector is properly tuned.")
         return
     
-    print(f"\nCollapse Events: {len(collapsed)} ({len(collapsed)/len(cpu_df)*100:.2f}% of samples)")
+    print(f"\nCollapse Events: {len(col_idx)} ({len(col_idx)/len(collapse_arr)*100:.2f}% of samples)")
     
-    if len(collapsed) > 0:
+    if len(col_idx) > 0:
         print("\n" + "="*70)
         print("RLE Behavior During Collapse Events")
         print("="*70)
@@ -131,72 +277,79 @@ def collapse_analysis(cpu_df):
         
         metrics = ['rle_smoothed', 'rle_raw', 'util_pct', 'power_w', 'a_load', 't_sustain_s']
         
-        for metric in metrics:
-            if metric in cpu_df.columns:
-                normal_val = normal[metric].mean()
-                collapsed_val = collapsed[metric].mean()
+        metrics = [m for m in metrics if m in cols]
+        
+        if metrics:
+            # Normal/collapsed means of every metric at once: one-hot group
+            # matrix times the NaN-zeroed metric block, over the non-NaN counts
+            block = np.column_stack([cols[m] for m in metrics])
+            valid = ~np.isnan(block)
+            groups = np.column_stack([collapse_arr == 0, collapse_arr == 1]).astype(np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                normal_vals, collapsed_vals = (groups.T @ np.where(valid, block, 0.0)) / (groups.T @ valid)
+            
+            for metric, normal_val, collapsed_val in zip(metrics, normal_vals, collapsed_vals):
                 diff = collapsed_val - normal_val
-                
                 print(f"{metric:<25} {normal_val:<15.4f} {collapsed_val:<15.4f} {diff:<15.4f}")
         
         # Check load distribution during collapse
-        if 'util_pct' in collapsed.columns:
+        if 'util_pct' in cols:
+            util = cols['util_pct'][col_idx]
             print(f"\nUtilization during collapse:")
-            print(f"  Mean: {collapsed['util_pct'].mean():.1f}%")
-            print(f"  Range: {collapsed['util_pct'].min():.1f}% - {collapsed['util_pct'].max():.1f}%")
+            print(f"  Mean: {nan_stat(util, np.mean):.1f}%")
+            print(f"  Range: {nan_stat(util, np.min):.1f}% - {nan_stat(util, np.max):.1f}%")
         
         # Analyze pre-collapse behavior
         print("\n" + "="*70)
         print("Pre-Collapse Behavior (10 samples before each collapse)")
         print("="*70)
         
-        collapse_indices = cpu_df[cpu_df['collapse'] == 1].index
+        # Row positions of the first 10 collapses (limited to avoid overwhelming output)
+        collapse_pos = col_idx[:10]
         
-        pre_collapse_data = []
-        for idx in collapse_indices[:10]:  # Limit to first 10 collapses to avoid overwhelming output
-            pre_start = max(0, idx - 10)
-            pre_samples = cpu_df.loc[pre_start:idx-1]
-            if len(pre_samples) > 0:
-                pre_collapse_data.append(pre_samples)
+        # The 10 CPU rows before each collapse, gathered in one fancy-index
+        rows = collapse_pos[:, None] + np.arange(-10, 0)[None, :]
+        rows = rows[rows >= 0]
         
-        if pre_collapse_data:
-            pre_df = pd.concat(pre_collapse_data)
+        if rows.size > 0:
+            # Each column is gathered and reduced in place; the trigger level
+            # (rolling_peak) comes from the same gather as the other metrics
+            pre_means = {c: nan_stat(cols[c][rows], np.mean)
+                         for c in ['rle_smoothed', 'util_pct', 'power_w', 'a_load', 'rolling_peak']
+                         if c in cols}
             
-            print(f"Analyzed {len(pre_df)} pre-collapse samples")
+            print(f"Analyzed {len(rows)} pre-collapse samples")
             print(f"\nPre-collapse mean values:")
             
             for metric in ['rle_smoothed', 'util_pct', 'power_w', 'a_load']:
-                if metric in pre_df.columns:
-                    print(f"  {metric:<25} {pre_df[metric].mean():.4f}")
+                if metric in pre_means:
+                    print(f"  {metric:<25} {pre_means[metric]:.4f}")
             
-            print(f"\n  Collapse trigger: {pre_df['rolling_peak'].mean():.4f} (peak threshold)")
-
-def generate_report(cpu_df, correlations, model_features, output_file="sessions/archive/rle_analysis_report.txt"):
-    """Generate comprehensive report"""
-    with open(output_file, 'w') as f:
-        f.write("="*70 + "\n")
-        f.write("RLE DRIVER ANALYSIS REPORT\n")
-        f.write("="*70 + "\n\n")
-        
-        f.write(f"Dataset: {len(cpu_df)} CPU samples\n")
-        f.write(f"Duration: {len(cpu_df) / 3600:.2f} hours\n")
-        f.write(f"\nMean RLE: {cpu_df['rle_smoothed'].mean():.4f}\n")
-        f.write(f"Std RLE: {cpu_df['rle_smoothed'].std():.4f}\n")
-        
-        f.write("\n" + "="*70 + "\n")
-        f.write("KEY FINDINGS\n")
-        f.write("="*70 + "\n")
-        
-        if correlations:
-            f.write("\nTop 3 RLE Correlations:\n")
-            for i, (col, r, _) in enumerate(correlations[:3], 1):
-                f.write(f"  {i}. {col}: {r:.4f}\n")
-        
-        if 'collapse' in cpu_df.columns:
-            collapse_count = (cpu_df['collapse'] == 1).sum()
-            f.write(f"\nCollapse events: {collapse_count} ({collapse_count/len(cpu_df)*100:.2f}%)\n")
-        
-        f.write(f"\nReport generated to: {output_file}\n")
+            if 'rolling_peak' in pre_means:
+                print(f"\n  Collapse trigger: {pre_means['rolling_peak']:.4f} (peak threshold)")
+
+def generate_report(cols, correlations, model_features, output_file="sessions/archive/rle_analysis_report.txt"):
+    """Generate comprehensive report (built in memory, written in one call)"""
+    rle = cols['rle_smoothed']
+    buf = [
+        BAR, "RLE DRIVER ANALYSIS REPORT\n", BAR, "\n",
+        f"Dataset: {len(rle)} CPU samples\n",
+        f"Duration: {len(rle) / 3600:.2f} hours\n",
+        f"\nMean RLE: {nan_stat(rle, np.mean):.4f}\n",
+        f"Std RLE: {nan_stat(rle, lambda v: v.std(ddof=1)):.4f}\n",
+        "\n", BAR, "KEY FINDINGS\n", BAR,
+    ]
+    
+    if correlations:
+        buf.append("\nTop 3 RLE Correlations:\n")
+        buf += [f"  {i}. {col}: {r:.4f}\n" for i, (col, r, _) in enumerate(correlations[:3], 1)]
+    
+    if 'collapse' in cols:
+        collapse_count = np.count_nonzero(cols['collapse'] == 1)
+        buf.append(f"\nCollapse events: {collapse_count} ({collapse_count/len(rle)*100:.2f}%)\n")
+    
+    buf.append(f"\nReport generated to: {output_file}\n")
+    Path(output_file).write_text(''.join(buf))
     
     print(f"\n" + "="*70)
     print(f"Report saved: {output_file}")
@@ -210,23 +363,34 @@ def main():
     
     # Load and clean data
     print(f"Loading: {args.csv}")
-    df = pd.read_csv(args.csv)
+    df = load_session(args.csv)
     
     df = df.dropna(subset=['timestamp'])
-    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True, errors='coerce')
-    df = df.drop_duplicates(subset=['timestamp', 'device'])
-    df = df.sort_values('timestamp').reset_index(drop=True)
     
-    # CPU data only
-    cpu_df = df[df['device'] == 'cpu'].copy()
+    # Sort on the dedupe key, then keep the first row of each run of equal
+    # (timestamp, device); the stable sort keeps file order within a run, so
+    # this keeps the same rows as drop_duplicates without hashing every key
+    df = df.sort_values(['timestamp', 'device'], kind='stable')
+    ts = df['timestamp'].to_numpy(dtype='datetime64[ns]').view('i8')  # NaT compares equal as int
+    dev = df['device'].cat.codes.to_numpy()
+    first = np.ones(len(df), dtype=bool)
+    first[1:] = (ts[1:] != ts[:-1]) | (dev[1:] != dev[:-1])
+    df = df[first].reset_index(drop=True)
+    
+    # CPU data only; device is categorical, so this compares category codes.
+    # No copy: the analyses only read it, through column_arrays
+    cpu_df = df[df['device'] == 'cpu']
     
     print(f"\nLoaded {len(cpu_df)} CPU samples")
     
+    # Every analysis reads the same columns, so pull them out as arrays once
+    cols = column_arrays(cpu_df)
+    
     # Run analyses
-    correlations = correlation_analysis(cpu_df)
-    model, features = regression_model(cpu_df)
-    collapse_analysis(cpu_df)
-    generate_report(cpu_df, correlations, features)
+    correlations = correlation_analysis(cols)
+    model, features = regression_model(cols)
+    collapse_analysis(cols)
+    generate_report(cols, correlations, features)
     
     print("\n" + "="*70)
     print("ANALYSIS COMPLETE")
@@ -6,57 +6,96 @@ Quantifies the temporal advantage: RLE predicts collapse before hardware respond
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import argparse
 from pathlib import Path
 
+from session_cache import CSV_ENGINE
+from series_utils import centered_mean, decimate
+
+# Only the columns the analyses read are parsed; measurements load as float32
+# and device as a categorical
+SESSION_COLUMNS = ['timestamp', 'device', 'rle_smoothed', 'cpu_freq_ghz', 'power_w', 'temp_c', 'collapse']
+MEASUREMENT_COLUMNS = ['rle_smoothed', 'cpu_freq_ghz', 'power_w', 'temp_c']
+
+PLOT_DPI = 200
+
+def load_session(path):
+    """Read the analysed columns of a session CSV with explicit dtypes"""
+    # pyarrow needs an explicit column list, so read the header first
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {c: 'float32' for c in MEASUREMENT_COLUMNS if c in header}
+    if 'device' in header:
+        dtypes['device'] = 'category'
+    df = pd.read_csv(path, usecols=[c for c in SESSION_COLUMNS if c in header],
+                     dtype=dtypes, engine=CSV_ENGINE)
+    
+    # Timestamps are parsed once here for both the analysis and the plot.
+    # ISO8601 accepts isoformat()'s mix of whole and fractional seconds, which
+    # an inferred format would turn into NaT for one of the devices
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True, errors='coerce')
+    return df
+
+def first_difference(x):
+    """x[i] - x[i-1], NaN for the first row (Series.diff on an array)"""
+    return np.concatenate(([np.nan], np.diff(x)))
+
+def device_timeline(df, device):
+    """
+    One device's rows in time order, with seconds since its first sample
+    Expects timestamps already parsed by load_session; NaT rows sort last and
+    get NaN seconds
+    """
+    device_df = df[df['device'] == device].copy()
+    if len(device_df) == 0:
+        return device_df
+    
+    if not device_df['timestamp'].is_monotonic_increasing:
+        device_df = device_df.sort_values('timestamp', kind='stable')
+    ts = device_df['timestamp'].to_numpy(dtype='datetime64[ns]')
+    device_df['seconds'] = (ts - ts[0]) / np.timedelta64(1, 's')
+    return device_df
+
+def first_after(secs, events, t):
+    """Time of the first event row strictly after t (rows in time order), or None"""
+    hits = np.flatnonzero(events & (secs > t))
+    return secs[hits[0]] if hits.size else None
+
 def analyze_lead_time(df, device='cpu'):
     """Find RLE drop before frequency wobble/collapse"""
     
-    device_df = df[df['device'] == device].copy()
+    device_df = device_timeline(df, device)
     if len(device_df) == 0:
         return None
-    
-    # Parse timestamps
-    device_df['timestamp'] = pd.to_datetime(device_df['timestamp'], utc=True, errors='coerce')
-    device_df['seconds'] = (device_df['timestamp'] - device_df['timestamp'].min()).dt.total_seconds()
+    secs = device_df['seconds'].to_numpy()
     
     # Smooth RLE for trend detection
-    device_df['rle_smooth'] = device_df['rle_smoothed'].rolling(window=10, center=True).mean()
-    device_df['rle_slope'] = device_df['rle_smooth'].diff()
-    
-    # Find major RLE drops (>20% from peak)
-    rle_peak = device_df['rle_smoothed'].max()
-    rle_drops = device_df[device_df['rle_smoothed'] < 0.8 * rle_peak]
-    
-    if len(rle_drops) == 0:
+    device_df['rle_smooth'] = centered_mean(device_df['rle_smoothed'].to_numpy(), 10)
+    device_df['rle_slope'] = first_difference(device_df['rle_smooth'].to_numpy())
+    
+    # Find major RLE drops (>20% from peak); rows are in time order, so the
+    # first one is the earliest
+    rle = device_df['rle_smoothed'].to_numpy()
+    drops = rle < 0.8 * np.nanmax(rle)
+    if not drops.any():
         return None
     
-    first_drop_time = rle_drops['seconds'].min()
+    first_drop = np.argmax(drops)
+    first_drop_time = secs[first_drop]
     
     # Look for hardware response
     # Check for frequency changes (if cpu_freq_ghz exists)
     frequency_events = None
     if 'cpu_freq_ghz' in device_df.columns:
-        device_df['freq_smooth'] = device_df['cpu_freq_ghz'].rolling(window=10, center=True).mean()
-        device_df['freq_slope'] = device_df['freq_smooth'].diff()
+        freq_slope = first_difference(centered_mean(device_df['cpu_freq_ghz'].to_numpy(), 10))
         
-        # Find frequency drops (>50 MHz)
-        freq_drops = device_df[device_df['freq_slope'] < -0.05]
-        if len(freq_drops) > 0:
-            first_freq_event = freq_drops[freq_drops['seconds'] > first_drop_time]['seconds'].min()
-            if pd.notna(first_freq_event):
-                frequency_events = first_freq_event
+        # First frequency drop (>50 MHz) after the RLE drop
+        frequency_events = first_after(secs, freq_slope < -0.05, first_drop_time)
     
     # Check for collapse flags
     collapse_events = None
     if 'collapse' in device_df.columns:
         collapse_col = pd.to_numeric(device_df['collapse'], errors='coerce').fillna(0)
-        collapses = device_df[collapse_col > 0]
-        if len(collapses) > 0:
-            first_collapse = collapses[collapses['seconds'] > first_drop_time]['seconds'].min()
-            if pd.notna(first_collapse):
-                collapse_events = first_collapse
+        collapse_events = first_after(secs, collapse_col.to_numpy() > 0, first_drop_time)
     
     # Calculate lead times
     lead_times = {}
@@ -70,7 +109,7 @@ def analyze_lead_time(df, device='cpu'):
     result = {
         'device': device,
         'first_drop_time': first_drop_time,
-        'rle_at_drop': device_df[device_df['seconds'] == first_drop_time]['rle_smoothed'].values[0] if len(device_df[device_df['seconds'] == first_drop_time]) > 0 else None,
+        'rle_at_drop': rle[np.searchsorted(secs, first_drop_time)],
         'frequency_event': frequency_events,
         'collapse_event': collapse_events,
         'lead_times': lead_times
@@ -86,24 +125,33 @@ def plot_lead_time_analysis(df, results, output_dir):
         return
     
     device = results['device']
-    device_df = df[df['device'] == device].copy()
-    
-    # Parse timestamps
-    device_df['timestamp'] = pd.to_datetime(device_df['timestamp'], utc=True, errors='coerce')
-    device_df['seconds'] = (device_df['timestamp'] - device_df['timestamp'].min()).dt.total_seconds()
+    device_df = device_timeline(df, device)
     
     # Focus on the event window (±5 minutes around first drop)
     first_drop = results['first_drop_time']
     window_start = max(0, first_drop - 300)
     window_end = first_drop + 300
     
-    window_df = device_df[(device_df['seconds'] >= window_start) & (device_df['seconds'] <= window_end)].copy()
+    secs = device_df['seconds'].to_numpy()
+    lo = np.searchsorted(secs, window_start, side='left')
+    hi = np.searchsorted(secs, window_end, side='right')
+    window_df = device_df.iloc[lo:hi]
+    
+    # Deferred: only --plot needs matplotlib, and the bare Figure API renders
+    # PNGs without pyplot's backend discovery and figure registry
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(14, 10))
+    axes = fig.subplots(4, 1)
     
-    fig, axes = plt.subplots(4, 1, figsize=(14, 10))
+    # High-rate sessions put more samples in the window than the figure has
+    # pixel columns; plot at most one min/max pair per column
+    px = int(fig.get_figwidth() * PLOT_DPI)
+    t = window_df['seconds']
     
     # Panel 1: RLE with drop marker
     ax1 = axes[0]
-    ax1.plot(window_df['seconds'], window_df['rle_smoothed'], label='RLE', linewidth=1.5, color='blue')
+    ax1.plot(*decimate(t, window_df['rle_smoothed'], px), label='RLE', linewidth=1.5, color='blue')
     ax1.axvline(first_drop, color='red', linestyle='--', linewidth=2, label=f'RLE Drop (t={first_drop:.0f}s)')
     ax1.set_ylabel('RLE', fontsize=11)
     ax1.set_title(f'{device.upper()} Lead-Time Analysis: RLE Predicts Hardware Response', fontsize=13, fontweight='bold')
@@ -113,7 +161,7 @@ def plot_lead_time_analysis(df, results, output_dir):
     # Panel 2: Frequency response (if available)
     if 'cpu_freq_ghz' in window_df.columns:
         ax2 = axes[1]
-        ax2.plot(window_df['seconds'], window_df['cpu_freq_ghz'], label='CPU Frequency', linewidth=1.5, color='green')
+        ax2.plot(*decimate(t, window_df['cpu_freq_ghz'], px), label='CPU Frequency', linewidth=1.5, color='green')
         if results['frequency_event']:
             ax2.axvline(results['frequency_event'], color='orange', linestyle='--', linewidth=2, 
                        label=f'Frequency Response (t={results["frequency_event"]:.0f}s)')
@@ -128,7 +176,7 @@ def plot_lead_time_analysis(df, results, output_dir):
     
     # Panel 3: Power
     ax3 = axes[2]
-    ax3.plot(window_df['seconds'], window_df['power_w'], label='Power', linewidth=1.5, color='purple')
+    ax3.plot(*decimate(t, window_df['power_w'], px), label='Power', linewidth=1.5, color='purple')
     ax3.axvline(first_drop, color='red', linestyle='--', linewidth=2)
     ax3.set_ylabel('Power (W)', fontsize=11)
     ax3.set_title('Power Consumption', fontsize=12)
@@ -137,7 +185,7 @@ def plot_lead_time_analysis(df, results, output_dir):
     
     # Panel 4: Temperature
     ax4 = axes[3]
-    ax4.plot(window_df['seconds'], window_df['temp_c'], label='Temperature', linewidth=1.5, color='darkred')
+    ax4.plot(*decimate(t, window_df['temp_c'], px), label='Temperature', linewidth=1.5, color='darkred')
     ax4.axvline(first_drop, color='red', linestyle='--', linewidth=2)
     ax4.set_xlabel('Time (seconds)', fontsize=11)
     ax4.set_ylabel('Temperature (°C)', fontsize=11)
@@ -145,10 +193,9 @@ def plot_lead_time_analysis(df, results, output_dir):
     ax4.legend()
     ax4.grid(alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/rle_lead_time_{device}.png', dpi=200, bbox_inches='tight')
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/rle_lead_time_{device}.png', dpi=PLOT_DPI, bbox_inches='tight')
     print(f"\nSaved: {output_dir}/rle_lead_time_{device}.png")
-    plt.close()
     
     # Print summary
     print("\n" + "="*70)
@@ -180,7 +227,7 @@ def main():
     print("RLE LEAD-TIME ANALYSIS")
     print("="*70)
     
-    df = pd.read_csv(args.csv)
+    df = load_session(args.csv)
     
     # Analyze lead-time
     results = analyze_lead_time(df, device=args.device)
@@ -4,9 +4,24 @@ Scikit-learn Integration for RLE Analysis
 Machine learning models for RLE prediction, anomaly detection, and optimization
 """
 
+import os
+import hashlib
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, IsolationForest
+
+# Opt-in Intel oneDAL kernels (RLE_USE_SKLEARNEX=1); must patch before the
+# sklearn estimators are imported. Off by default so results stay reproducible.
+# When active, detect_anomaly's IsolationForest scoring also runs on oneDAL.
+SKLEARNEX_ACTIVE = False
+if os.environ.get('RLE_USE_SKLEARNEX', '').lower() in ('1', 'true', 'yes'):
+    try:
+        from sklearnex import patch_sklearn
+        patch_sklearn()
+        SKLEARNEX_ACTIVE = True
+    except ImportError:
+        pass
+
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor, IsolationForest
 from sklearn.linear_model import LinearRegression, Ridge
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
@@ -19,42 +34,127 @@ from typing import Dict, List, Tuple, Optional, Any
 import warnings
 warnings.filterwarnings('ignore')
 
+# Saved models are LZ4-compressed when lz4 is installed (pip install lz4);
+# otherwise they are written uncompressed, which load_model can memory-map
+try:
+    import lz4  # noqa: F401
+    MODEL_COMPRESS = ('lz4', 3)
+except ImportError:
+    MODEL_COMPRESS = 0
+
+# RAPIDS FIL (cuML) runs the forest as a flat tree layout on the GPU for bulk
+# RLE scoring. Treelite's CPU paths (GTIL, compiled tl2cgen libraries) were
+# slower than sklearn's own predict here, so there is no CPU export
+try:
+    from cuml import ForestInference
+    CUML_AVAILABLE = True
+except ImportError:
+    CUML_AVAILABLE = False
+
+from session_cache import CSV_ENGINE
+
+# Feature sets of each model
+PREDICTOR_FEATURES = [
+    'util_pct', 'temp_c', 'power_w', 'a_load', 't_sustain_s',
+    'cpu_freq_mhz', 'cpu_cores_active', 'cpu_temp_max',
+    'gpu_memory_used_gb', 'gpu_memory_total_gb', 'gpu_fan_pct', 'gpu_clock_mhz',
+    'memory_used_gb', 'memory_total_gb', 'memory_util_pct',
+    'disk_used_gb', 'disk_total_gb', 'disk_util_pct'
+]
+ANOMALY_FEATURES = [
+    'rle_smoothed', 'rle_raw', 'E_th', 'E_pw',
+    'util_pct', 'temp_c', 'power_w', 'a_load', 't_sustain_s',
+    'cpu_freq_mhz', 'gpu_clock_mhz', 'memory_util_pct'
+]
+OPTIMIZER_FEATURES = [
+    'util_pct', 'temp_c', 'power_w', 'a_load',
+    'cpu_freq_mhz', 'gpu_clock_mhz', 'memory_util_pct'
+]
+# Per-cluster averages reported by RLEOptimizer
+CLUSTER_SUMMARY = {
+    'avg_rle': 'rle_smoothed',
+    'avg_temp': 'temp_c',
+    'avg_power': 'power_w',
+    'avg_util': 'util_pct'
+}
+SESSION_FEATURES = list(dict.fromkeys(
+    ['rle_smoothed'] + PREDICTOR_FEATURES + ANOMALY_FEATURES + OPTIMIZER_FEATURES
+))
+
+class SessionFeatures:
+    """Zero-filled float32 feature matrix and scaler shared by the models of one session
+    
+    Built once so the trainers slice columns instead of each re-reading the
+    DataFrame. The anomaly detector and optimizer fit on every row and share
+    the scaler; the predictor fits its own on the training split.
+    """
+    
+    def __init__(self, df: pd.DataFrame, columns: List[str] = SESSION_FEATURES):
+        self.names = [col for col in columns if col in df.columns]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        # One float32 copy, NaN zeroed in place; trees split in float32 anyway
+        self.matrix = df[self.names].to_numpy(dtype=np.float32)
+        self.present = ~np.isnan(self.matrix)  # for NaN-skipping averages
+        self.matrix[~self.present] = 0
+        self.scaler = StandardScaler().fit(self.matrix)
+    
+    def __len__(self) -> int:
+        return len(self.matrix)
+    
+    def available(self, columns: List[str]) -> List[str]:
+        return [col for col in columns if col in self.index]
+    
+    def block(self, columns: List[str]) -> np.ndarray:
+        return self.matrix[:, [self.index[col] for col in columns]]
+    
+    def scaler_for(self, columns: List[str]) -> StandardScaler:
+        """The shared scaler restricted to columns (already fit)"""
+        idx = [self.index[col] for col in columns]
+        scaler = StandardScaler()
+        scaler.mean_ = self.scaler.mean_[idx]
+        scaler.var_ = self.scaler.var_[idx]
+        scaler.scale_ = self.scaler.scale_[idx]
+        scaler.n_features_in_ = len(idx)
+        scaler.n_samples_seen_ = self.scaler.n_samples_seen_
+        return scaler
+
+def _session_features(data) -> SessionFeatures:
+    return data if isinstance(data, SessionFeatures) else SessionFeatures(data)
+
+def _feature_matrix(X, feature_names: List[str]) -> np.ndarray:
+    """(N, n_features) float32 matrix, matching training, from a DataFrame (missing columns and NaN -> 0) or array"""
+    if isinstance(X, pd.DataFrame):
+        return X.reindex(columns=feature_names, fill_value=0).fillna(0).to_numpy(dtype=np.float32)
+    return np.asarray(X, dtype=np.float32).reshape(-1, len(feature_names))
+
 class RLEPredictor:
     """Machine learning model for RLE prediction"""
     
-    def __init__(self):
+    def __init__(self, n_jobs: int = -1):
         self.model = None
+        self.n_jobs = n_jobs  # workers for random forest fits (-1 = all cores)
+        self.fil_model = None  # fast tree predictor from export_fil()
         self.scaler = StandardScaler()
         self.feature_names = []
         self.is_trained = False
         
-    def prepare_features(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
-        """Prepare features and target for training"""
-        # Select features for RLE prediction
-        feature_columns = [
-            'util_pct', 'temp_c', 'power_w', 'a_load', 't_sustain_s',
-            'cpu_freq_mhz', 'cpu_cores_active', 'cpu_temp_max',
-            'gpu_memory_used_gb', 'gpu_memory_total_gb', 'gpu_fan_pct', 'gpu_clock_mhz',
-            'memory_used_gb', 'memory_total_gb', 'memory_util_pct',
-            'disk_used_gb', 'disk_total_gb', 'disk_util_pct'
-        ]
+    def prepare_features(self, data) -> Tuple[np.ndarray, np.ndarray]:
+        """Prepare features and target from a DataFrame or preloaded SessionFeatures"""
+        data = _session_features(data)
         
         # Filter available columns
-        available_features = [col for col in feature_columns if col in df.columns]
+        self.feature_names = data.available(PREDICTOR_FEATURES)
         
-        # Prepare features
-        X = df[available_features].fillna(0).values
-        y = df['rle_smoothed'].fillna(0).values
-        
-        self.feature_names = available_features
+        X = data.block(self.feature_names)
+        y = data.block(['rle_smoothed'])[:, 0]
         
         return X, y
     
-    def train(self, df: pd.DataFrame, model_type: str = 'random_forest') -> Dict[str, float]:
+    def train(self, data, model_type: str = 'random_forest') -> Dict[str, float]:
         """Train RLE prediction model"""
         print(f"Training RLE prediction model ({model_type})...")
         
-        X, y = self.prepare_features(df)
+        X, y = self.prepare_features(data)
         
         if len(X) < 10:
             print("Insufficient data for training")
@@ -63,13 +163,16 @@ class RLEPredictor:
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
-        # Scale features
+        # Scale features, fit on the training split only so test rows don't leak
+        self.scaler = StandardScaler()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
         # Choose model
         if model_type == 'random_forest':
-            self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+            self.model = RandomForestRegressor(n_estimators=100, n_jobs=self.n_jobs, random_state=42)
+        elif model_type == 'hist_gbr':
+            self.model = HistGradientBoostingRegressor(max_iter=200, early_stopping=True, random_state=42)
         elif model_type == 'linear':
             self.model = LinearRegression()
         elif model_type == 'ridge':
@@ -78,6 +181,7 @@ class RLEPredictor:
             raise ValueError(f"Unknown model type: {model_type}")
         
         # Train model
+        self.fil_model = None
         self.model.fit(X_train_scaled, y_train)
         
         # Evaluate
@@ -98,21 +202,51 @@ class RLEPredictor:
         
         return metrics
     
+    def predict_batch(self, X) -> np.ndarray:
+        """Predict RLE for every row of a DataFrame or (N, n_features) array"""
+        if not self.is_trained:
+            return np.zeros(len(X))
+        
+        X = _feature_matrix(X, self.feature_names)
+        X_scaled = self.scaler.transform(X)
+        if self.fil_model is not None:
+            prediction = self.fil_model(X_scaled)
+        else:
+            prediction = self.model.predict(X_scaled)
+        
+        return np.maximum(prediction, 0.0)  # Ensure non-negative
+    
     def predict(self, features: Dict[str, float]) -> float:
         """Predict RLE value from features"""
         if not self.is_trained:
             return 0.0
         
-        # Convert features to array
-        feature_array = np.array([features.get(name, 0) for name in self.feature_names]).reshape(1, -1)
+        row = [features.get(name, 0) for name in self.feature_names]
+        return float(self.predict_batch(row)[0])
+    
+    def export_fil(self):
+        """Load the trained random forest into cuML's Forest Inference Library
         
-        # Scale features
-        feature_scaled = self.scaler.transform(feature_array)
+        Stores the FIL predictor on the instance so predict_batch uses it, and
+        returns it; returns None (sklearn predict stays in use) when cuML is
+        missing or the model is not a tree ensemble.
+        """
+        if not self.is_trained or not CUML_AVAILABLE or not hasattr(self.model, 'estimators_'):
+            return None
+        
+        try:
+            fil = ForestInference.load_from_sklearn(self.model, output_class=False)
+        except Exception as e:
+            print(f"FIL export failed ({e}), keeping sklearn predict")
+            return None
         
-        # Predict
-        prediction = self.model.predict(feature_scaled)[0]
+        def predict_fil(X):
+            out = fil.predict(np.ascontiguousarray(X, dtype=np.float32))
+            out = out.get() if hasattr(out, 'get') else np.asarray(out)  # cupy -> host
+            return out.reshape(len(X)).astype(np.float64)
         
-        return max(0.0, prediction)  # Ensure non-negative
+        self.fil_model = predict_fil
+        return self.fil_model
     
     def get_feature_importance(self) -> Dict[str, float]:
         """Get feature importance (for tree-based models)"""
@@ -128,18 +262,21 @@ class RLEPredictor:
             model_data = {
                 'model': self.model,
                 'scaler': self.scaler,
-                'feature_names': self.feature_names
+                'feature_names': tuple(self.feature_names)
             }
-            joblib.dump(model_data, path)
+            joblib.dump(model_data, path, compress=MODEL_COMPRESS)
             print(f"Model saved to {path}")
     
     def load_model(self, path: str):
         """Load trained model"""
         if Path(path).exists():
-            model_data = joblib.load(path)
+            # Uncompressed files map their arrays read-only instead of copying
+            # them to the heap (joblib ignores mmap_mode for compressed files)
+            model_data = joblib.load(path, mmap_mode='r')
             self.model = model_data['model']
             self.scaler = model_data['scaler']
-            self.feature_names = model_data['feature_names']
+            self.feature_names = list(model_data['feature_names'])
+            self.fil_model = None
             self.is_trained = True
             print(f"Model loaded from {path}")
 
@@ -149,28 +286,24 @@ class RLEAnomalyDetector:
     def __init__(self):
         self.model = IsolationForest(contamination=0.1, random_state=42)
         self.scaler = StandardScaler()
+        self.feature_names = []
         self.is_trained = False
     
-    def train(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Train anomaly detection model"""
+    def train(self, data) -> Dict[str, Any]:
+        """Train anomaly detection model from a DataFrame or preloaded SessionFeatures"""
         print("Training RLE anomaly detection model...")
         
-        # Select features for anomaly detection
-        feature_columns = [
-            'rle_smoothed', 'rle_raw', 'E_th', 'E_pw',
-            'util_pct', 'temp_c', 'power_w', 'a_load', 't_sustain_s',
-            'cpu_freq_mhz', 'gpu_clock_mhz', 'memory_util_pct'
-        ]
-        
-        available_features = [col for col in feature_columns if col in df.columns]
-        X = df[available_features].fillna(0).values
+        data = _session_features(data)
+        self.feature_names = data.available(ANOMALY_FEATURES)
+        X = data.block(self.feature_names)
         
         if len(X) < 10:
             print("Insufficient data for anomaly detection training")
             return {}
         
         # Scale features
-        X_scaled = self.scaler.fit_transform(X)
+        self.scaler = data.scaler_for(self.feature_names)
+        X_scaled = self.scaler.transform(X)
         
         # Train model
         self.model.fit(X_scaled)
@@ -191,29 +324,26 @@ class RLEAnomalyDetector:
         
         return metrics
     
+    def detect_anomaly_batch(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """Anomaly flags and scores for every row of a DataFrame or (N, n_features) array"""
+        if not self.is_trained:
+            return np.zeros(len(X), dtype=bool), np.zeros(len(X))
+        
+        X = _feature_matrix(X, self.feature_names)
+        # IsolationForest.predict flags exactly the negative decision scores
+        anomaly_scores = self.model.decision_function(self.scaler.transform(X))
+        
+        return anomaly_scores < 0, anomaly_scores
+    
     def detect_anomaly(self, features: Dict[str, float]) -> Tuple[bool, float]:
         """Detect if features represent an anomaly"""
         if not self.is_trained:
             return False, 0.0
         
-        # Convert features to array
-        feature_array = np.array([features.get(name, 0) for name in [
-            'rle_smoothed', 'rle_raw', 'E_th', 'E_pw',
-            'util_pct', 'temp_c', 'power_w', 'a_load', 't_sustain_s',
-            'cpu_freq_mhz', 'gpu_clock_mhz', 'memory_util_pct'
-        ]]).reshape(1, -1)
-        
-        # Scale features
-        feature_scaled = self.scaler.transform(feature_array)
-        
-        # Predict anomaly
-        prediction = self.model.predict(feature_scaled)[0]
-        anomaly_score = self.model.decision_function(feature_scaled)[0]
-        
-        is_anomaly = prediction == -1
-        
-        return is_anomaly, anomaly_score
-
+        row = [features.get(name, 0) for name in self.feature_names]
+        is_anomaly, anomaly_score = self.detect_anomaly_batch(row)
+        return bool(is_anomaly[0]), float(anomaly_score[0])
+    
 class RLEOptimizer:
     """Optimization for RLE performance"""
     
@@ -222,50 +352,48 @@ class RLEOptimizer:
         self.pca_model = None
         self.is_trained = False
     
-    def train(self, df: pd.DataFrame, n_clusters: int = 5) -> Dict[str, Any]:
-        """Train optimization model"""
+    def train(self, data, n_clusters: int = 5) -> Dict[str, Any]:
+        """Train optimization model from a DataFrame or preloaded SessionFeatures"""
         print(f"Training RLE optimization model ({n_clusters} clusters)...")
         
-        # Select features for clustering
-        feature_columns = [
-            'util_pct', 'temp_c', 'power_w', 'a_load',
-            'cpu_freq_mhz', 'gpu_clock_mhz', 'memory_util_pct'
-        ]
-        
-        available_features = [col for col in feature_columns if col in df.columns]
-        X = df[available_features].fillna(0).values
+        data = _session_features(data)
+        available_features = data.available(OPTIMIZER_FEATURES)
+        X = data.block(available_features)
         
         if len(X) < n_clusters:
             print("Insufficient data for optimization training")
             return {}
         
         # Scale features
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+        X_scaled = data.scaler_for(available_features).transform(X)
         
         # Apply PCA for dimensionality reduction
         self.pca_model = PCA(n_components=min(3, len(available_features)))
         X_pca = self.pca_model.fit_transform(X_scaled)
         
         # Cluster the data
-        self.cluster_model = KMeans(n_clusters=n_clusters, random_state=42)
+        # Single k-means++ start (older sklearn defaults to 10 restarts); full-batch
+        # Lloyd beat MiniBatchKMeans on large sessions of this 3-D PCA space
+        self.cluster_model = KMeans(n_clusters=n_clusters, init='k-means++', n_init=1, random_state=42)
         clusters = self.cluster_model.fit_predict(X_pca)
         
-        # Analyze clusters
-        df_clustered = df.copy()
-        df_clustered['cluster'] = clusters
+        # Analyze clusters: per-cluster sums over non-NaN cells (NaN were filled
+        # with 0), one bincount pass keyed by (cluster, summary column)
+        summary_cols = [data.index[col] for col in CLUSTER_SUMMARY.values()]
+        n_summary = len(summary_cols)
+        sizes = np.bincount(clusters, minlength=n_clusters)
+        cells = (clusters[:, None] * n_summary + np.arange(n_summary)).ravel()
+        sums = np.bincount(cells, weights=data.matrix[:, summary_cols].ravel(),
+                           minlength=n_clusters * n_summary)
+        counts = np.bincount(cells, weights=data.present[:, summary_cols].ravel(),
+                             minlength=n_clusters * n_summary)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = (sums / counts).reshape(n_clusters, n_summary)
         
         cluster_analysis = {}
-        for cluster_id in range(n_clusters):
-            cluster_data = df_clustered[df_clustered['cluster'] == cluster_id]
-            if len(cluster_data) > 0:
-                cluster_analysis[cluster_id] = {
-                    'size': len(cluster_data),
-                    'avg_rle': cluster_data['rle_smoothed'].mean(),
-                    'avg_temp': cluster_data['temp_c'].mean(),
-                    'avg_power': cluster_data['power_w'].mean(),
-                    'avg_util': cluster_data['util_pct'].mean()
-                }
+        for cluster_id in np.flatnonzero(sizes):
+            cluster_analysis[int(cluster_id)] = {'size': int(sizes[cluster_id])}
+            cluster_analysis[int(cluster_id)].update(zip(CLUSTER_SUMMARY, means[cluster_id]))
         
         self.is_trained = True
         
@@ -274,7 +402,7 @@ class RLEOptimizer:
         return {
             'n_clusters': n_clusters,
             'cluster_analysis': cluster_analysis,
-            'pca_explained_variance': self.pca_model.explained_variance_ratio_.sum()
+            'pca_explained_variance': float(self.pca_model.explained_variance_ratio_.sum())
         }
     
     def get_optimal_settings(self, target_rle: float = 0.5) -> Dict[str, float]:
@@ -298,30 +426,72 @@ class RLEOptimizer:
         
         return optimal_settings
 
+# Trained models per session CSV; bump FEATURES_VERSION whenever the feature
+# sets or model settings change so stale entries are retrained
+MODEL_CACHE_DIR = Path.home() / '.cache' / 'rle_ml'
+FEATURES_VERSION = 1
+
+def _model_cache_path(csv_path: str) -> Path:
+    """Cache file keyed by the CSV's resolved path only, so a rewritten CSV
+    overwrites its entry instead of adding another"""
+    key = str(Path(csv_path).resolve())
+    return MODEL_CACHE_DIR / f"{hashlib.blake2b(key.encode()).hexdigest()[:16]}.joblib"
+
+def _model_cache_stamp(csv_path: str) -> Tuple[float, int, int]:
+    """(mtime, size, FEATURES_VERSION) stored in the entry to detect stale models"""
+    stat = os.stat(csv_path)
+    return stat.st_mtime, stat.st_size, FEATURES_VERSION
+
 class RLEMLAnalyzer:
     """Main ML analyzer for RLE data"""
     
-    def __init__(self):
-        self.predictor = RLEPredictor()
+    def __init__(self, n_jobs: int = -1):
+        self.predictor = RLEPredictor(n_jobs=n_jobs)
         self.anomaly_detector = RLEAnomalyDetector()
         self.optimizer = RLEOptimizer()
     
-    def analyze_session(self, csv_path: str) -> Dict[str, Any]:
-        """Analyze a session CSV with ML models"""
+    def analyze_session(self, csv_path: str, force_retrain: bool = False,
+                        use_cache: bool = True) -> Dict[str, Any]:
+        """Analyze a session CSV with ML models
+        
+        Models trained on an unchanged CSV are reloaded from MODEL_CACHE_DIR
+        unless force_retrain is set; use_cache=False neither reads nor writes
+        the cache.
+        """
         print(f"Analyzing session: {csv_path}")
         
-        # Load data
-        df = pd.read_csv(csv_path)
+        cache_path = _model_cache_path(csv_path)
+        stamp = _model_cache_stamp(csv_path)
+        if use_cache and not force_retrain and cache_path.exists():
+            try:
+                cached_stamp, *models, results = joblib.load(cache_path)
+                if cached_stamp == stamp:
+                    self.predictor, self.anomaly_detector, self.optimizer = models
+                    print(f"Loaded cached models from {cache_path}")
+                    return results
+            except Exception as e:
+                print(f"Warning: could not load cached models ({e}), retraining")
+        
+        # Load only the model columns, parsed straight to float32 (pyarrow
+        # needs an explicit column list, so read the header first)
+        header = pd.read_csv(csv_path, nrows=0).columns
+        usecols = [col for col in SESSION_FEATURES if col in header]
+        df = pd.read_csv(csv_path, usecols=usecols, dtype=dict.fromkeys(usecols, 'float32'),
+                         engine=CSV_ENGINE)
         
         if len(df) < 10:
             print("Insufficient data for ML analysis")
             return {}
         
+        # One shared feature matrix for all three models
+        features = SessionFeatures(df)
+        del df
+        
         results = {}
         
         # Train and evaluate predictor
         try:
-            predictor_metrics = self.predictor.train(df, 'random_forest')
+            predictor_metrics = self.predictor.train(features, 'random_forest')
             results['predictor'] = predictor_metrics
             
             # Get feature importance
@@ -334,7 +504,7 @@ class RLEMLAnalyzer:
         
         # Train anomaly detector
         try:
-            anomaly_metrics = self.anomaly_detector.train(df)
+            anomaly_metrics = self.anomaly_detector.train(features)
             results['anomaly_detector'] = anomaly_metrics
             
         except Exception as e:
@@ -343,13 +513,24 @@ class RLEMLAnalyzer:
         
         # Train optimizer
         try:
-            optimizer_metrics = self.optimizer.train(df)
+            optimizer_metrics = self.optimizer.train(features)
             results['optimizer'] = optimizer_metrics
             
         except Exception as e:
             print(f"Optimizer training failed: {e}")
             results['optimizer'] = {'error': str(e)}
         
+        # Cache only complete runs; write-then-rename so readers never see a partial file
+        if use_cache and not any('error' in results[name] for name in ('predictor', 'anomaly_detector', 'optimizer')):
+            try:
+                MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+                joblib.dump((stamp, self.predictor, self.anomaly_detector, self.optimizer, results),
+                            tmp_path, compress=MODEL_COMPRESS)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"Warning: could not cache trained models ({e})")
+        
         return results
     
     def predict_rle(self, features: Dict[str, float]) -> float:
@@ -408,13 +589,18 @@ def test_ml_integration():
     # Test ML analyzer
     analyzer = RLEMLAnalyzer()
     
+    # Untrained models fall back to neutral answers instead of raising
+    assert analyzer.predict_rle({'util_pct': 50.0}) == 0.0
+    assert analyzer.detect_anomaly({'util_pct': 50.0}) == (False, 0.0)
+    
     # Save to temporary CSV
     temp_csv = "temp_rle_data.csv"
     df.to_csv(temp_csv, index=False)
     
     try:
         # Analyze session
-        results = analyzer.analyze_session(temp_csv)
+        # Fresh models every run, and nothing left behind in MODEL_CACHE_DIR
+        results = analyzer.analyze_session(temp_csv, force_retrain=True, use_cache=False)
         
         print("ML Analysis Results:")
         print(f"Predictor R²: {results.get('predictor', {}).get('r2', 'N/A')}")
@@ -6,8 +6,94 @@ waste, instability, and time-to-burnout in physical systems.
 """
 
 import numpy as np
-from typing import Tuple, Dict, List
-from collections import deque
+from typing import Tuple, Dict, List, NamedTuple
+
+# bottleneck's O(N) moving windows replace sliding_window_view when installed
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# Numba compiles the per-sample kernel for streaming callers (pip install
+# numba); without it the same scalar code runs as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+class RLEMetrics(NamedTuple):
+    """RLE_real and its intermediate values for one sample (use ._asdict() for JSON)"""
+    RLE_real: float
+    Q_in: float
+    P_useful: float
+    Q_waste: float
+    energy_utilization: float
+    S_stability: float
+    eta_conv: float
+    A_load: float
+    T_sustain: float
+    burnout_penalty: float
+    N_noise: float
+    numerator: float
+    denominator: float
+
+
+def _mean_std(values, n):
+    """Welford mean and population std of values[:n]"""
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        delta = values[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (values[i] - mean)
+    return mean, np.sqrt(m2 / n) if n > 0 else 0.0
+
+
+def _compute_rle_real_kernel(Q_in, P_useful, P_rated, out_hist, out_len,
+                             temp_current, temp_limit, temp_hist, temp_len, temp_rise_rate):
+    """
+    Scalar core of compute_rle_real over the first out_len/temp_len entries
+    of two float64 windows. Returns (RLE_real, Q_waste, energy_utilization,
+    S_stability, eta_conv, A_load, T_sustain, burnout_penalty, N_noise,
+    numerator, denominator).
+    """
+    # Waste, utilization, conversion efficiency and load aggressiveness
+    Q_waste = max(Q_in - P_useful, 0.0)
+    energy_utilization = 1 - Q_waste / Q_in if Q_in > 0 else 0.0
+    eta_conv = P_useful / Q_in if Q_in > 0 else 0.0
+    A_load = P_useful / P_rated if P_rated > 0 else 0.0
+    
+    # S_stability from output history (stable if no variation)
+    out_mean, out_std = _mean_std(out_hist, out_len)
+    if out_len > 1 and out_mean != 0:
+        S_stability = 1 / (1 + out_std / out_mean)
+    else:
+        S_stability = 1.0
+    
+    # Burnout penalty as rise rate over thermal headroom (cooling or steady
+    # -> 0; at or past the limit -> very large); T_sustain is its reciprocal
+    headroom = max(temp_limit - temp_current, 1e-9)
+    burnout_penalty = max(temp_rise_rate, 0.0) / headroom
+    T_sustain = 1.0 / burnout_penalty if burnout_penalty > 0 else np.inf
+    
+    # N_noise (thermal instability)
+    _, temp_std = _mean_std(temp_hist, temp_len)
+    N_noise = temp_std / 5.0 if temp_len > 1 else 0.0
+    
+    numerator = energy_utilization * S_stability * eta_conv
+    denominator = (A_load + burnout_penalty) * (1 + N_noise)
+    RLE_real = numerator / denominator if denominator > 0 else 0.0
+    
+    return (RLE_real, Q_waste, energy_utilization, S_stability, eta_conv, A_load,
+            T_sustain, burnout_penalty, N_noise, numerator, denominator)
+
+
+if NUMBA_AVAILABLE:
+    _mean_std = njit(cache=True)(_mean_std)
+    _compute_rle_real_kernel = njit(cache=True)(_compute_rle_real_kernel)
 
 
 def compute_rle_real(
@@ -20,7 +106,7 @@ def compute_rle_real(
     temp_history: np.ndarray,
     temp_rise_rate: float,
     window_size: int = 10
-) -> Dict:
+) -> RLEMetrics:
     """
     Compute RLE_real metric and all intermediate values.
     
@@ -47,74 +133,110 @@ def compute_rle_real(
     
     Returns:
     --------
-    dict : Dictionary containing RLE_real and all intermediate values
+    RLEMetrics : RLE_real and all intermediate values
     """
     
-    # Limit history to last window_size elements
-    if len(output_history) > window_size:
-        output_history = output_history[-window_size:]
-    if len(temp_history) > window_size:
-        temp_history = temp_history[-window_size:]
-    
-    # Compute Q_waste
-    Q_waste = max(Q_in - P_useful, 0)
-    
-    # Compute energy_utilization
-    if Q_in > 0:
-        energy_utilization = 1 - Q_waste / Q_in
-    else:
-        energy_utilization = 0
-    
-    # Compute S_stability from output history
-    if len(output_history) > 1 and np.mean(output_history) != 0:
-        stability_ratio = np.std(output_history) / np.mean(output_history)
-        S_stability = 1 / (1 + stability_ratio)
-    else:
-        S_stability = 1.0  # Assume stable if no variation
-    
-    # Compute eta_conv (conversion efficiency)
-    if Q_in > 0:
-        eta_conv = P_useful / Q_in
-    else:
-        eta_conv = 0
-    
-    # Compute A_load (aggressiveness of load)
-    if P_rated > 0:
-        A_load = P_useful / P_rated
-    else:
-        A_load = 0
-    
-    # Compute T_sustain (time to burnout)
-    if temp_rise_rate > 0:
-        T_sustain = (temp_limit - temp_current) / temp_rise_rate
-        # Prevent negative T_sustain
-        if T_sustain < 0:
-            T_sustain = 1e-6  # Very small value
-    else:
-        # System is cooling or steady
-        T_sustain = 1e6  # Very large value
-    
-    # Compute burnout penalty
-    burnout_penalty = 1 / T_sustain
-    
-    # Compute N_noise (thermal instability)
-    if len(temp_history) > 1:
-        N_noise = np.std(temp_history) / 5.0
-    else:
-        N_noise = 0
-    
-    # Compute numerator
-    numerator = energy_utilization * S_stability * eta_conv
-    
-    # Compute denominator
-    denominator = (A_load + burnout_penalty) * (1 + N_noise)
-    
-    # Compute RLE_real
-    if denominator > 0:
-        RLE_real = numerator / denominator
+    # Last window_size elements as zero-copy views (float64 arrays pass through as-is)
+    output_history = np.asarray(output_history, dtype=np.float64)
+    temp_history = np.asarray(temp_history, dtype=np.float64)
+    out_w = output_history if output_history.shape[0] <= window_size else output_history[-window_size:]
+    temp_w = temp_history if temp_history.shape[0] <= window_size else temp_history[-window_size:]
+    
+    (RLE_real, Q_waste, energy_utilization, S_stability, eta_conv, A_load,
+     T_sustain, burnout_penalty, N_noise, numerator, denominator) = _compute_rle_real_kernel(
+        float(Q_in), float(P_useful), float(P_rated), out_w, out_w.shape[0],
+        float(temp_current), float(temp_limit), temp_w, temp_w.shape[0], float(temp_rise_rate)
+    )
+    
+    return RLEMetrics(
+        RLE_real, Q_in, P_useful, Q_waste, energy_utilization, S_stability, eta_conv,
+        A_load, T_sustain, burnout_penalty, N_noise, numerator, denominator
+    )
+
+
+def _trailing_mean_std(x: np.ndarray, window_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mean, population std and sample count of the trailing window ending at
+    each index (the first window_size-1 windows are partial).
+    """
+    n = len(x)
+    if BOTTLENECK_AVAILABLE and n:
+        # bottleneck rejects windows longer than the series
+        w = min(window_size, n)
+        mean = bn.move_mean(x, window=w, min_count=1)
+        std = bn.move_std(x, window=w, min_count=1)
     else:
-        RLE_real = 0
-    
+        mean = np.empty(n)
+        std = np.empty(n)
+        head = min(window_size - 1, n)
+        for i in range(head):
+            mean[i] = x[:i + 1].mean()
+            std[i] = x[:i + 1].std()
+        if n >= window_size:
+            windows = np.lib.stride_tricks.sliding_window_view(x, window_size)
+            mean[head:] = windows.mean(axis=1)
+            std[head:] = windows.std(axis=1)
+    count = np.minimum(np.arange(1, n + 1), window_size)
+    return mean, std, count
+
+
+def _simulate_vectorized(
+    duration: int,
+    P_rated: float,
+    temp_limit: float,
+    temp_start: float,
+    P_useful_start: float,
+    P_useful_end: float,
+    efficiency_start: float,
+    efficiency_end: float,
+    window_size: int = 10
+) -> Dict[str, np.ndarray]:
+    """
+    Compute every per-tick simulation metric as whole arrays.
+
+    Mirrors compute_rle_real applied tick by tick; returns a dict keyed by
+    the RLEMetrics fields (plus 'temp'), each an array of length duration.
+    """
+    t = np.arange(duration)
+    P_useful = P_useful_start + (P_useful_end - P_useful_start) * (t / duration)
+
+    # Temperature rises faster (quadratically) once load passes rated
+    A_load_local = P_useful / P_rated
+    base_rise_rate = 0.1  # °C/s at no load
+    temp_rise_rate = np.where(
+        A_load_local > 1.0,
+        base_rise_rate + 0.3 * (A_load_local - 1.0) ** 2,
+        base_rise_rate * A_load_local + 0.01
+    )
+    temp_current = temp_start + np.cumsum(temp_rise_rate)
+
+    # Efficiency degrades with the temperature at the start of each tick
+    temp_before = temp_current - temp_rise_rate
+    temp_factor = np.clip((temp_before - temp_start) / (temp_limit - temp_start), 0, 1)
+    efficiency = efficiency_start - (efficiency_start - efficiency_end) * temp_factor
+    # Non-positive efficiency falls back to Q_in = P_useful
+    Q_in = P_useful / np.where(efficiency > 0, efficiency, 1.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Q_waste = np.maximum(Q_in - P_useful, 0)
+        energy_utilization = np.where(Q_in > 0, 1 - Q_waste / Q_in, 0.0)
+        eta_conv = np.where(Q_in > 0, P_useful / Q_in, 0.0)
+
+        out_mean, out_std, count = _trailing_mean_std(P_useful, window_size)
+        S_stability = np.where((count > 1) & (out_mean != 0), 1 / (1 + out_std / out_mean), 1.0)
+
+        A_load = A_load_local if P_rated > 0 else np.zeros(duration)
+
+        burnout_penalty = np.maximum(temp_rise_rate, 0) / np.maximum(temp_limit - temp_current, 1e-9)
+        T_sustain = 1 / burnout_penalty  # inf where the penalty is 0
+
+        _, temp_std, _ = _trailing_mean_std(temp_current, window_size)
+        N_noise = np.where(count > 1, temp_std / 5.0, 0.0)
+
+        numerator = energy_utilization * S_stability * eta_conv
+        denominator = (A_load + burnout_penalty) * (1 + N_noise)
+        RLE_real = np.where(denominator > 0, numerator / denominator, 0.0)
+
     return {
         'RLE_real': RLE_real,
         'Q_in': Q_in,
@@ -128,7 +250,8 @@ def compute_rle_real(
         'burnout_penalty': burnout_penalty,
         'N_noise': N_noise,
         'numerator': numerator,
-        'denominator': denominator
+        'denominator': denominator,
+        'temp': temp_current
     }
 
 
@@ -141,7 +264,7 @@ def simulate_device(
     P_useful_end: float = 260.0,
     efficiency_start: float = 0.7,
     efficiency_end: float = 0.5
-) -> Tuple[List[float], List[float], List[float], List[Dict], List[float], List[int]]:
+) -> Tuple[List[float], List[float], List[float], List[RLEMetrics], List[float], List[int]]:
     """
     Simulate device operation over time.
     
@@ -150,107 +273,44 @@ def simulate_device(
     rle_values : list of RLE_real values
     temp_values : list of temperature values
     a_load_values : list of A_load values
-    all_metrics : list of metric dictionaries
+    all_metrics : list of RLEMetrics per tick
     times : list of time values in seconds
     collapse_points : list of indices where RLE_real collapses
     """
     
-    # Initialize state
-    temp_current = temp_start
-    t = 0
-    
-    # Rolling windows
-    window_size = 10
-    output_history = deque(maxlen=window_size)
-    temp_history = deque(maxlen=window_size)
+    sim = _simulate_vectorized(
+        duration, P_rated, temp_limit, temp_start,
+        P_useful_start, P_useful_end, efficiency_start, efficiency_end
+    )
+    rle = sim['RLE_real']
+    a_load = sim['A_load']
     
-    # Storage
-    rle_values = []
-    temp_values = []
-    a_load_values = []
-    all_metrics = []
-    times = []
-    
-    while t < duration:
-        # Linear ramp of useful power
-        P_useful = P_useful_start + (P_useful_end - P_useful_start) * (t / duration)
-        
-        # Compute efficiency degradation based on temperature
-        temp_factor = (temp_current - temp_start) / (temp_limit - temp_start)
-        temp_factor = max(0, min(1, temp_factor))  # Clamp to [0, 1]
-        efficiency = efficiency_start - (efficiency_start - efficiency_end) * temp_factor
-        
-        # Compute Q_in
-        if efficiency > 0:
-            Q_in = P_useful / efficiency
-        else:
-            Q_in = P_useful
-        
-        # Compute temp_rise_rate based on load
-        # Higher load = higher temp rise
-        # If A_load > 1, temp rises faster
-        A_load_local = P_useful / P_rated
-        base_rise_rate = 0.1  # °C/s at no load
-        # Increase rise rate quadratically when past rated
-        if A_load_local > 1.0:
-            temp_rise_rate = base_rise_rate + 0.3 * ((A_load_local - 1.0) ** 2)
-        else:
-            temp_rise_rate = base_rise_rate * A_load_local + 0.01
-        
-        # Update temperature
-        temp_current += temp_rise_rate
-        
-        # Update histories
-        output_history.append(P_useful)
-        temp_history.append(temp_current)
-        
-        # Convert to numpy arrays
-        output_hist_arr = np.array(output_history)
-        temp_hist_arr = np.array(temp_history)
-        
-        # Compute RLE_real
-        metrics = compute_rle_real(
-            Q_in=Q_in,
-            P_useful=P_useful,
-            P_rated=P_rated,
-            output_history=output_hist_arr,
-            temp_current=temp_current,
-            temp_limit=temp_limit,
-            temp_history=temp_hist_arr,
-            temp_rise_rate=temp_rise_rate,
-            window_size=window_size
-        )
-        
-        # Store values
-        rle_values.append(metrics['RLE_real'])
-        temp_values.append(temp_current)
-        a_load_values.append(metrics['A_load'])
-        all_metrics.append(metrics)
-        times.append(t)
-        
-        t += 1
+    # Per-tick metrics, as compute_rle_real would return them
+    columns = [sim[field].tolist() for field in RLEMetrics._fields]
+    all_metrics = list(map(RLEMetrics._make, zip(*columns)))
     
     # Identify collapse point - sustained decline from peak
     collapse_points = []
-    if rle_values and len(rle_values) > 20:  # Need sufficient data
+    if len(rle) > 20:  # Need sufficient data
         # Find peak RLE
-        max_rle = max(rle_values)
-        max_rle_idx = rle_values.index(max_rle)
+        max_rle_idx = int(np.argmax(rle))
+        max_rle = rle[max_rle_idx]
         
         # Look for sustained drop - after peak, find where it stays below threshold
         threshold_drop = 0.3  # 30% sustained drop from max indicates collapse
         
-        # Start checking well after the peak
-        for i in range(max_rle_idx + 10, len(rle_values)):
-            # Check if RLE has dropped significantly and stays low
-            recent_values = rle_values[max(i-5, 0):i+1]
-            avg_recent = np.mean(recent_values) if recent_values else 0
-            
-            if avg_recent < max_rle - threshold_drop and a_load_values[i] > 1.0:
-                collapse_points.append(i)
-                break
-    
-    return rle_values, temp_values, a_load_values, all_metrics, times, collapse_points
+        # Start checking well after the peak; 6-sample trailing mean
+        start = max_rle_idx + 10
+        if start < len(rle):
+            csum = np.concatenate(([0.0], np.cumsum(rle)))
+            idx = np.arange(start, len(rle))
+            lo = np.maximum(idx - 5, 0)
+            avg_recent = (csum[idx + 1] - csum[lo]) / (idx + 1 - lo)
+            hits = np.flatnonzero((avg_recent < max_rle - threshold_drop) & (a_load[idx] > 1.0))
+            if len(hits):
+                collapse_points.append(int(idx[hits[0]]))
+    
+    return rle.tolist(), sim['temp'].tolist(), a_load.tolist(), all_metrics, list(range(duration)), collapse_points
 
 
 def plot_results(
@@ -8,7 +8,6 @@ and computes RLE_real to assess system efficiency and stress.
 import numpy as np
 import time
 from typing import List, Dict
-from collections import deque
 import matplotlib.pyplot as plt
 from datetime import datetime
 import sys
@@ -316,9 +315,12 @@ def run_live_test(duration: int = 60, interval: float = 1.0, auto_stress: bool =
     
     print("\nPress Ctrl+C to stop early\n")
     
-    # State variables
-    output_history = deque(maxlen=10)
-    temp_history = deque(maxlen=10)
+    # State variables: fixed ring buffers for the rolling windows (the
+    # window stats ignore order, so the filled prefix is passed as a view)
+    window_size = 10
+    output_history = np.empty(window_size)
+    temp_history = np.empty(window_size)
+    filled = 0
     
     # Storage
     timestamps = []
@@ -358,18 +360,20 @@ def run_live_test(duration: int = 60, interval: float = 1.0, auto_stress: bool =
                 temp_rise_rate *= 1.5  # Accelerate near limit
             
             # Update histories
-            output_history.append(P_useful)
-            temp_history.append(cpu_temp)
+            slot = i % window_size
+            output_history[slot] = P_useful
+            temp_history[slot] = cpu_temp
+            filled = min(filled + 1, window_size)
             
             # Compute RLE_real
             rle_metrics = compute_rle_real_live(
                 P_useful=P_useful,
                 Q_in=Q_in,
                 P_rated=P_rated,
-                output_history=np.array(output_history),
+                output_history=output_history[:filled],
                 temp_current=cpu_temp,
                 temp_limit=temp_limit,
-                temp_history=np.array(temp_history),
+                temp_history=temp_history[:filled],
                 temp_rise_rate=temp_rise_rate
             )
             
@@ -30,19 +30,19 @@ def analyze_thermal_isolation(df):
     # Align by timestamp (within 1 second)
     aligned_data = []
     
-    for cpu_idx, cpu_row in cpu_df.iterrows():
-        cpu_time = cpu_row['timestamp']
+    cpu_rows = cpu_df[['timestamp', 'temp_c', 'rle_smoothed', 'power_w']].itertuples(index=False, name=None)
+    for cpu_time, cpu_temp, cpu_rle, cpu_power in cpu_rows:
         # Find GPU samples within 1 second
         gpu_close = gpu_df[abs((gpu_df['timestamp'] - cpu_time).dt.total_seconds()) < 1]
         
         if len(gpu_close) > 0:
             gpu_row = gpu_close.iloc[0]
             aligned_data.append({
-                'cpu_temp': cpu_row['temp_c'],
+                'cpu_temp': cpu_temp,
                 'gpu_temp': gpu_row.get('vram_temp_c', gpu_row['temp_c']),
-                'cpu_rle': cpu_row['rle_smoothed'],
+                'cpu_rle': cpu_rle,
                 'gpu_rle': gpu_row['rle_smoothed'],
-                'cpu_power': cpu_row['power_w'],
+                'cpu_power': cpu_power,
                 'gpu_power': gpu_row['power_w']
             })
     
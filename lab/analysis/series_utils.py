@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Shared series helpers for the session analyses and plots
+"""
+
+import numpy as np
+
+# bottleneck's moving mean replaces the cumsum fallback when installed
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+
+def centered_mean(x, window):
+    """
+    Centered moving mean in O(N)
+    Matches Series.rolling(window, center=True).mean(): NaN where the window is
+    incomplete or contains a NaN
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.full(len(x), np.nan)
+    if len(x) < window:
+        return out
+    
+    # Window k covers rows k..k+window-1 and is labelled at its center row
+    start = window - 1 - (window - 1) // 2
+    if BOTTLENECK_AVAILABLE:
+        # move_mean labels each window at its last row and already yields NaN
+        # for windows holding a NaN
+        means = bn.move_mean(x, window)[window - 1:]
+    else:
+        missing = np.isnan(x)
+        csum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, x))))
+        nans = np.concatenate(([0], np.cumsum(missing)))
+        means = (csum[window:] - csum[:-window]) / window
+        means[nans[window:] > nans[:-window]] = np.nan
+    out[start:start + len(means)] = means
+    return out
+
+
+def decimate(t, y, n: int = 600):
+    """
+    Min/max decimate a series to ~n blocks so spikes survive downsampling
+    Returns (t, y) with the block minimum and maximum at each block start
+    """
+    t = np.asarray(t)
+    y = np.asarray(y, dtype=float)
+    if len(y) <= 2 * n:
+        return t, y
+    stride = -(-len(y) // n)
+    blocks = np.pad(y, (0, -len(y) % stride), mode='edge').reshape(-1, stride)
+    lo = np.fmin.reduce(blocks, axis=1)
+    hi = np.fmax.reduce(blocks, axis=1)
+    return np.repeat(t[::stride], 2), np.column_stack([lo, hi]).ravel()
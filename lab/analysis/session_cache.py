@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Parquet cache for session CSVs
+Materializes each session CSV once to a sibling .parquet file so repeated
+analyses only load the columns they touch
+"""
+
+from pathlib import Path
+import pandas as pd
+
+# Parquet needs pyarrow; without it sessions are read straight from CSV
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    PYARROW_AVAILABLE = False
+    CSV_ENGINE = 'c'
+
+# Core telemetry columns parsed straight to float32 (sensor precision is far
+# below float64); read_csv ignores entries for columns a file doesn't have.
+# Timestamps are kept as written so the session's own UTC offset survives
+SESSION_DTYPES = {
+    'timestamp': 'str',
+    'temp_c': 'float32',
+    'rle_smoothed': 'float32',
+    'power_w': 'float32',
+    'rle_norm': 'float32',
+    'F_mu': 'float32',
+}
+
+def _narrow_dtypes(df):
+    """Store remaining floats as float32 and the 0/1 collapse flag as int8
+
+    collapse is narrowed after parsing because a blank cell would make an
+    int8 read fail.
+    """
+    floats = df.select_dtypes(include='float64').columns
+    df[floats] = df[floats].astype('float32')
+    if 'collapse' in df.columns and df['collapse'].notna().all():
+        df['collapse'] = df['collapse'].astype('int8')
+    return df
+
+# Bumped whenever the cached layout changes, so stale caches are rebuilt
+CACHE_SUFFIX = '.v2.parquet'
+
+def ensure_parquet(csv_path):
+    """Write (or refresh) the Parquet copy of a session CSV, returning its path
+
+    Returns None when pyarrow is missing or the cache cannot be written.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = csv_path.with_suffix(CACHE_SUFFIX)
+    if not PYARROW_AVAILABLE:
+        return None
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return parquet_path
+    try:
+        # C engine: pyarrow parses offset timestamps to UTC before dtype applies
+        df = _narrow_dtypes(pd.read_csv(csv_path, dtype=SESSION_DTYPES, engine='c', low_memory=False))
+        df.to_parquet(parquet_path, index=False)
+    except Exception as e:
+        print(f"Warning: could not cache {csv_path.name} as Parquet ({e}), reading CSV")
+        return None
+    return parquet_path
+
+def read_session(csv_path, columns=None, dtype=None):
+    """Read a session, from its Parquet cache when possible"""
+    parquet_path = ensure_parquet(csv_path)
+    if parquet_path is not None:
+        df = pd.read_parquet(parquet_path, columns=columns)
+    else:
+        # Same parse as the cache build, so the fallback keeps timestamp offsets
+        df = _narrow_dtypes(pd.read_csv(csv_path, usecols=columns, dtype=SESSION_DTYPES,
+                                        engine='c', low_memory=False))
+    return df.astype(dtype) if dtype else df